@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Literal, Optional, Tuple, Union, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
-from ..interface import DataAccess
+from ..interface import DataAccess, DateBoundKind, KpiTotals
 from ..models import (
     CustomerFilters, OrderFilters, OrderItemsFilters, ProductFilters, StoreFilters,
     InventoryFilters, PromotionFilters, CustomerResponse, ProductResponse, StoreResponse,
@@ -26,17 +33,154 @@ except ImportError:
     from config import get_config
 
 
+def _and(mask, cond):
+    """Fold a condition into an optional accumulated boolean mask.
+
+    Keeping the mask lazy means filter-free calls allocate nothing, and each
+    set filter costs one AND instead of materializing an intermediate frame.
+    """
+    return cond if mask is None else (mask & cond)
+
+
+def _sorted_unique(df: pd.DataFrame, col: str) -> list:
+    """Sorted distinct values of a column; empty when the table lacks it."""
+    if df.empty or col not in df:
+        return []
+    return sorted(df[col].dropna().unique().tolist())
+
+
+def _date_bounds(df: pd.DataFrame, lo_col: str, hi_col: str):
+    """(min, max) of a table's date columns as python datetimes, or None."""
+    if df.empty:
+        return None
+    return (
+        pd.to_datetime(df[lo_col].min()).to_pydatetime(),
+        pd.to_datetime(df[hi_col].max()).to_pydatetime(),
+    )
+
+
+def _as_seq(value):
+    """Normalize a scalar-or-list filter field to a list; None stays None.
+
+    The *Filters models accept both shapes, so every membership filter can
+    take the isin path instead of branching on the runtime type per call.
+    """
+    if value is None or isinstance(value, list):
+        return value
+    return [value]
+
+
+def _project(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """Apply a filter's column projection; None returns the frame untouched."""
+    return df if columns is None else df[columns]
+
+
+def _shape(df: pd.DataFrame, filters) -> pd.DataFrame:
+    """Apply a filter's LIMIT/OFFSET and column projection to a result.
+
+    Positional slices before the projection, so the work done past the
+    predicate stage is bounded by the rows and columns actually returned.
+    """
+    if filters.offset:
+        df = df.iloc[filters.offset:]
+    if filters.limit is not None:
+        df = df.iloc[:filters.limit]
+    return _project(df, filters.columns)
+
+
+@functools.cache
+def _find_repo_root() -> Path:
+    """Locate the repository root once per process.
+
+    Walks up from the working directory looking for pyproject.toml or
+    databricks.yml; falls back to the working directory itself.
+    """
+    current = Path.cwd()
+    for parent in [current] + list(current.parents):
+        if (parent / "pyproject.toml").exists() or (parent / "databricks.yml").exists():
+            return parent
+    return current
+
+
 @dataclass
 class _Tables:
+    # Kept normalized: orders is indexed by order_id, products by product_id and
+    # stores by store_id so per-call joins can take the indexed fast path.
+    # Only the required tables live here; the optional ones (customers,
+    # inventory, promotions) are loaded lazily on the backend (see the
+    # cached properties on CsvDataAccess).
     orders: pd.DataFrame
     order_items: pd.DataFrame
     products: pd.DataFrame
     stores: pd.DataFrame
-    customers: pd.DataFrame
-    inventory: pd.DataFrame
-    promotions: pd.DataFrame
-    # Pre-joined "order lines" view to avoid re-joining every call
-    lines: pd.DataFrame  # columns after join; see _build_lines()
+    # Derived search index: product names as an Arrow string array, positions
+    # aligned with products.index
+    product_name_arr: pa.Array
+    # Inverted index: store_name -> Index of store_ids, resolved once at load
+    # instead of scanning the stores frame on every filtered call
+    store_ids_by_name: dict
+
+
+class CsvFilteredView:
+    """One evaluated filter set shared by several queries.
+
+    Holds the filtered orders slice and the matching product_ids; the joined
+    line shapes are materialized lazily and at most once each, so the KPIs,
+    the orders table and the product-count chart all reuse a single filter
+    evaluation instead of re-running it per query.
+    """
+
+    def __init__(self, backend: "CsvDataAccess", orders_subset: pd.DataFrame,
+                 product_ids: Optional[pd.Index]) -> None:
+        self._backend = backend
+        self._orders_subset = orders_subset
+        self._product_ids = product_ids
+        self._items: Optional[pd.DataFrame] = None   # lean join (no dims)
+        self._lines: Optional[pd.DataFrame] = None   # join incl. dim columns
+
+    def _lean_lines(self) -> pd.DataFrame:
+        if self._items is None:
+            if self._lines is not None:
+                # The wide shape is a superset; no need for a second join
+                self._items = self._lines
+            else:
+                self._items = self._backend._join_lines(
+                    self._orders_subset, product_ids=self._product_ids, dims=False
+                )
+        return self._items
+
+    def _full_lines(self) -> pd.DataFrame:
+        if self._lines is None:
+            self._lines = self._backend._join_lines(
+                self._orders_subset, product_ids=self._product_ids, dims=True
+            )
+        return self._lines
+
+    def kpis(self) -> KpiTotals:
+        return CsvDataAccess._kpis_from_items(self._lean_lines())
+
+    def orders(
+        self,
+        limit: int = 2000,
+        order_by: Literal["order_ts_desc", "order_ts_asc"] = "order_ts_desc",
+    ) -> pd.DataFrame:
+        return CsvDataAccess._select_order_rows(self._full_lines(), limit, order_by)
+
+    def product_counts(
+        self,
+        slice_by: Optional[Literal["store", "category", "hour"]] = None,
+        top_n: int = 25,
+    ) -> pd.DataFrame:
+        return CsvDataAccess._product_counts_frame(self._full_lines(), slice_by, top_n)
+
+    def orders_over_time(self) -> pd.DataFrame:
+        return CsvDataAccess._orders_over_time_frame(self._lean_lines())
+
+    def revenue_by_region(self) -> pd.DataFrame:
+        return CsvDataAccess._revenue_by_region_frame(self._full_lines())
+
+    def top_products_by_revenue(self, top_n: int = 10) -> pd.DataFrame:
+        return CsvDataAccess._top_products_by_revenue_frame(self._full_lines(), top_n)
 
 
 class CsvDataAccess(DataAccess):
@@ -54,28 +198,77 @@ class CsvDataAccess(DataAccess):
 
         self.data_dir = Path(data_dir)
 
-        # If the path is relative, make it relative to the repository root
+        # Relative paths resolve against the repository root, discovered once
+        # per process rather than re-walked on every construction
         if not self.data_dir.is_absolute():
-            # Try to find the repository root by looking for characteristic files
-            current = Path.cwd()
-            repo_root = None
-
-            # Look up the directory tree for pyproject.toml or databricks.yml
-            for parent in [current] + list(current.parents):
-                if (parent / "pyproject.toml").exists() or (parent / "databricks.yml").exists():
-                    repo_root = parent
-                    break
-
-            if repo_root:
-                self.data_dir = repo_root / self.data_dir
-            else:
-                # Fallback to current directory
-                self.data_dir = current / self.data_dir
+            self.data_dir = _find_repo_root() / self.data_dir
 
         self._tables = self._load_tables(self.data_dir)
+        self._options = self._build_options(self._tables)
 
     # ---------- loading / join helpers ----------
 
+    # Explicit Arrow column types for the four required tables, used for the
+    # one-time Parquet conversion in _ensure_parquet(). Pinning the schema
+    # skips per-column type inference and keeps the Parquet output stable
+    # regardless of what the CSV parser would guess.
+    _CSV_COLUMN_TYPES = {
+        "orders": {
+            "order_ts": pa.timestamp("s"),
+            "store_id": pa.int64(), "customer_id": pa.int64(), "discount_pct": pa.float32(),
+        },
+        "order_items": {
+            "line_number": pa.int64(), "product_id": pa.int64(), "qty": pa.int64(),
+            "unit_price": pa.float32(), "extended_price": pa.float32(),
+        },
+        "products": {
+            "product_id": pa.int64(), "base_price": pa.float32(),
+        },
+        "stores": {
+            "opened_date": pa.timestamp("s"),
+            "store_id": pa.int64(), "latitude": pa.float64(), "longitude": pa.float64(),
+        },
+    }
+
+    # Columns each required table is loaded with (explicit projection so unused
+    # columns can be dropped here without touching the files).
+    _TABLE_COLUMNS = {
+        "orders": ["order_id", "store_id", "customer_id", "order_ts", "payment_type", "discount_pct"],
+        "order_items": ["order_id", "line_number", "product_id", "qty", "unit_price", "extended_price"],
+        "products": ["product_id", "sku", "name", "category", "brand", "base_price"],
+        "stores": ["store_id", "name", "region", "city", "latitude", "longitude", "opened_date"],
+    }
+
+    @staticmethod
+    def _ensure_parquet(data_dir: Path, table: str) -> Path:
+        """Return the Parquet path for `table`, converting its CSV when needed.
+
+        Parquet is columnar and Snappy-compressed, so subsequent cold starts skip
+        CSV tokenization entirely and read far fewer bytes. The sidecar is
+        rebuilt whenever the CSV is newer, so a re-seeded dataset is never
+        served from a stale cache.
+        """
+        pq_path = data_dir / f"{table}.parquet"
+        csv_path = data_dir / f"{table}.csv"
+        stale = (
+            csv_path.exists()
+            and pq_path.exists()
+            and csv_path.stat().st_mtime > pq_path.stat().st_mtime
+        )
+        if not pq_path.exists() or stale:
+            # Arrow's CSV reader parses column chunks in parallel with the
+            # schema fixed up front, and the table goes straight to Parquet
+            # without a pandas round-trip.
+            arrow_table = pacsv.read_csv(
+                csv_path,
+                read_options=pacsv.ReadOptions(block_size=8 << 20),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=CsvDataAccess._CSV_COLUMN_TYPES[table]
+                ),
+            )
+            pq.write_table(arrow_table, pq_path, compression="snappy")
+        return pq_path
+
     @staticmethod
     def _load_tables(data_dir: Path) -> _Tables:
         # Check if data directory exists
@@ -88,11 +281,16 @@ class CsvDataAccess(DataAccess):
                 f"  3. Create a .env file with DATA_DIR=/path/to/your/data"
             )
 
-        # Required CSV files
-        required_files = ["orders.csv", "order_items.csv", "products.csv", "stores.csv"]
-        missing_files = [f for f in required_files if not (data_dir / f).exists()]
+        # Required tables: a Parquet sibling is preferred; the CSV is only needed
+        # for the one-time conversion.
+        required_tables = ["orders", "order_items", "products", "stores"]
+        missing_files = [
+            f"{t}.csv" for t in required_tables
+            if not (data_dir / f"{t}.parquet").exists() and not (data_dir / f"{t}.csv").exists()
+        ]
 
         if missing_files:
+            required_files = [f"{t}.csv" for t in required_tables]
             raise FileNotFoundError(
                 f"Required CSV files missing in {data_dir}:\n"
                 f"  Missing: {', '.join(missing_files)}\n"
@@ -104,67 +302,265 @@ class CsvDataAccess(DataAccess):
             )
 
         try:
-            orders = pd.read_csv(data_dir / "orders.csv", parse_dates=["order_ts"])
-            order_items = pd.read_csv(data_dir / "order_items.csv")
-            products = pd.read_csv(data_dir / "products.csv")
-            stores = pd.read_csv(data_dir / "stores.csv", parse_dates=["opened_date"])
-
-            # Load optional tables if they exist
-            customers = pd.DataFrame()
-            inventory = pd.DataFrame()
-            promotions = pd.DataFrame()
-
-            if (data_dir / "customers.csv").exists():
-                customers = pd.read_csv(data_dir / "customers.csv", parse_dates=["signup_ts"])
-            if (data_dir / "inventory_snapshots.csv").exists():
-                inventory = pd.read_csv(data_dir / "inventory_snapshots.csv", parse_dates=["snapshot_ts"])
-            if (data_dir / "promotions.csv").exists():
-                promotions = pd.read_csv(data_dir / "promotions.csv", parse_dates=["start_date", "end_date"])
+            def _read(table: str) -> pd.DataFrame:
+                path = CsvDataAccess._ensure_parquet(data_dir, table)
+                # memory_map lets the OS page the column buffers in on demand
+                # instead of copying whole files through userspace up front
+                return pq.read_table(
+                    path, columns=CsvDataAccess._TABLE_COLUMNS[table], memory_map=True
+                ).to_pandas()
+
+            # Arrow/pandas release the GIL while parsing, so the four reads
+            # overlap and cold-start cost drops to roughly the slowest file
+            with ThreadPoolExecutor(max_workers=len(required_tables)) as ex:
+                futures = {t: ex.submit(_read, t) for t in required_tables}
+                loaded = {t: f.result() for t, f in futures.items()}
+
+            orders = loaded["orders"]
+            order_items = loaded["order_items"]
+            products = loaded["products"]
+            stores = loaded["stores"]
+
+            # Retail quantities and prices fit comfortably in 16/32 bits;
+            # halving the element width halves the bytes every aggregation
+            # streams through the fact table
+            order_items["qty"] = order_items["qty"].astype(np.int16)
+            order_items[["unit_price", "extended_price"]] = (
+                order_items[["unit_price", "extended_price"]].astype(np.float32)
+            )
+            orders["discount_pct"] = orders["discount_pct"].astype(np.float32)
+            products["base_price"] = products["base_price"].astype(np.float32)
 
         except Exception as e:
             raise RuntimeError(
-                f"Error reading CSV files from {data_dir}: {e}\n"
-                f"Please check that the CSV files are valid and readable."
+                f"Error reading data files from {data_dir}: {e}\n"
+                f"Please check that the CSV/Parquet files are valid and readable."
             ) from e
 
         # Normalize names to avoid collisions
         products = products.rename(columns={"name": "product_name"})
         stores = stores.rename(columns={"name": "store_name"})
 
-        lines = CsvDataAccess._build_lines(orders, order_items, products, stores)
+        # Low-cardinality strings repeat across every joined line; categorical
+        # codes make equality filters and groupby hashing work on small ints
+        # instead of Python strings.
+        for col in ("product_name", "category", "brand"):
+            products[col] = products[col].astype("category")
+        for col in ("store_name", "region", "city"):
+            stores[col] = stores[col].astype("category")
+        orders["payment_type"] = orders["payment_type"].astype("category")
+
+        # Second resolution is plenty for retail order timestamps and lets the
+        # date window compare raw int64 seconds (see _orders_window)
+        orders["order_ts"] = orders["order_ts"].astype("datetime64[s]")
+
+        # Order ids are "O" + digits; parse the digits once at load so joins,
+        # window filters and nunique all run on int64 keys instead of hashing
+        # strings. The display string is rebuilt as "O" + str(key) only for
+        # the rows a query actually returns (see _select_order_rows).
+        orders["order_id"] = orders["order_id"].str.slice(1).astype(np.int64)
+        order_items["order_id"] = order_items["order_id"].str.slice(1).astype(np.int64)
+
+        # Index the dimension tables (and orders) so joins are on-index.
+        # orders is kept sorted by order_ts so date windows become positional
+        # slices (see _orders_window).
+        orders = orders.sort_values("order_ts", kind="stable").set_index("order_id")
+        # Hour bucket computed once at load; the orders-over-time aggregation
+        # groups on this column instead of re-flooring order_ts per call.
+        orders["order_hour"] = orders["order_ts"].values.astype("datetime64[h]")
+
+        # Align order_items to the order_ts order of their parent orders. The
+        # left-preserving inner merge in _join_lines then yields lines already
+        # sorted by order_ts, so get_orders can slice instead of sorting.
+        order_pos = orders.index.get_indexer(order_items["order_id"])
+        order_items = order_items.iloc[np.argsort(order_pos, kind="stable")].reset_index(drop=True)
+        products = products.set_index("product_id")
+        stores = stores.set_index("store_id")
+
+        # Product names as an Arrow string array; search runs a single
+        # case-insensitive match_substring kernel over it instead of a
+        # lower-then-contains double pass (see _matching_product_ids)
+        product_name_arr = pa.array(products["product_name"].astype(str))
+
+        store_ids_by_name = dict(stores.groupby("store_name", observed=True).groups)
 
         return _Tables(
             orders=orders,
             order_items=order_items,
             products=products,
             stores=stores,
-            customers=customers,
-            inventory=inventory,
-            promotions=promotions,
-            lines=lines,
+            product_name_arr=product_name_arr,
+            store_ids_by_name=store_ids_by_name,
         )
 
+    # ---------- optional tables (loaded on first access) ----------
+    # Sessions that only look at orders never pay for these reads.
+
+    @functools.cached_property
+    def _customers(self) -> pd.DataFrame:
+        path = self.data_dir / "customers.csv"
+        if not path.exists():
+            return pd.DataFrame()
+        df = pd.read_csv(path, parse_dates=["signup_ts"])
+        for col in ("segment", "home_region", "home_city"):
+            if col in df:
+                df[col] = df[col].astype("category")
+        return df
+
+    @functools.cached_property
+    def _inventory(self) -> pd.DataFrame:
+        path = self.data_dir / "inventory_snapshots.csv"
+        if not path.exists():
+            return pd.DataFrame()
+        return pd.read_csv(path, parse_dates=["snapshot_ts"])
+
+    @functools.cached_property
+    def _promotions(self) -> pd.DataFrame:
+        path = self.data_dir / "promotions.csv"
+        if not path.exists():
+            return pd.DataFrame()
+        df = pd.read_csv(path, parse_dates=["start_date", "end_date"])
+        if "promo_type" in df:
+            df["promo_type"] = df["promo_type"].astype("category")
+        if "discount_pct" in df:
+            df["discount_pct"] = df["discount_pct"].astype(np.float32)
+        return df
+
+    @staticmethod
+    def _build_options(t: _Tables) -> dict:
+        """Precompute the dropdown option lists and date bounds.
+
+        The loaded tables are immutable for the lifetime of the instance, so
+        the unique()+sorted() passes behind the list_* methods run once here
+        instead of on every call (the UI re-requests them per rerun). Options
+        derived from the lazily-loaded optional tables live in
+        _customer_options/_promo_options so they don't force those reads.
+        """
+        return {
+            "store_cities": _sorted_unique(t.stores, "city"),
+            "store_regions": _sorted_unique(t.stores, "region"),
+            "product_categories": _sorted_unique(t.products, "category"),
+            "product_brands": _sorted_unique(t.products, "brand"),
+            "payment_types": _sorted_unique(t.orders, "payment_type"),
+            "date_bounds": _date_bounds(t.orders, "order_ts", "order_ts"),
+            "store_open_bounds": _date_bounds(t.stores, "opened_date", "opened_date"),
+        }
+
+    @functools.cached_property
+    def _customer_options(self) -> dict:
+        df = self._customers
+        return {
+            "segments": _sorted_unique(df, "segment"),
+            "home_regions": _sorted_unique(df, "home_region"),
+            "home_cities": _sorted_unique(df, "home_city"),
+        }
+
+    @functools.cached_property
+    def _promo_options(self) -> dict:
+        df = self._promotions
+        return {
+            "types": _sorted_unique(df, "promo_type"),
+            "bounds": _date_bounds(df, "start_date", "end_date"),
+        }
+
+    # ---------- contract helpers ----------
+
     @staticmethod
-    def _build_lines(
-        orders: pd.DataFrame,
-        order_items: pd.DataFrame,
-        products: pd.DataFrame,
-        stores: pd.DataFrame,
+    def _to_arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+        """Convert a small result frame to PyArrow-backed extension dtypes.
+
+        Streamlit serializes frames to Arrow before rendering; handing it an
+        Arrow-backed frame makes that a buffer handoff instead of a full
+        conversion on every rerender. Only applied to the frames crossing the
+        API boundary, which are at most `limit`/top-N rows.
+        """
+        return df.convert_dtypes(dtype_backend="pyarrow")
+
+    def _orders_window(self, start_ts: Optional[datetime], end_ts: Optional[datetime]) -> pd.DataFrame:
+        """Contiguous slice of orders with order_ts inside [start_ts, end_ts].
+
+        orders stays sorted by order_ts (stored as datetime64[s]), so the
+        window is two pure int64 binary searches over the raw seconds view
+        plus a positional slice — no full-length boolean mask and no copy.
+        """
+        orders = self._tables.orders
+        ts = orders["order_ts"].to_numpy().view("int64")  # epoch seconds
+        ns = 1_000_000_000
+        lo = 0
+        hi = len(orders)
+        if start_ts is not None:
+            # Ceil to whole seconds so a sub-second start never admits an
+            # earlier second-resolution timestamp
+            start_s = -((-pd.Timestamp(start_ts).value) // ns)
+            lo = int(np.searchsorted(ts, np.int64(start_s), side="left"))
+        if end_ts is not None:
+            end_s = pd.Timestamp(end_ts).value // ns
+            hi = int(np.searchsorted(ts, np.int64(end_s), side="right"))
+        return orders.iloc[lo:hi]
+
+    def _matching_product_ids(self, category: Optional[str], product_search: Optional[str]) -> Optional[pd.Index]:
+        """Resolve product-level filters against the small products frame.
+
+        Returns the matching product_ids, or None when no product filter is set.
+        """
+        products = self._tables.products
+        pid_mask = None
+        if category:
+            pid_mask = (products["category"] == category)
+        if product_search and product_search.strip():
+            s = product_search.strip()
+            # One case-insensitive Arrow kernel pass over the cached name
+            # array; scales with unique products, not order lines
+            hits = pc.match_substring(self._tables.product_name_arr, s, ignore_case=True)
+            search_mask = np.asarray(hits)
+            pid_mask = search_mask if pid_mask is None else (pid_mask & search_mask)
+        return None if pid_mask is None else products.index[pid_mask]
+
+    def _join_lines(
+        self,
+        orders_subset: pd.DataFrame,
+        product_ids: Optional[pd.Index] = None,
+        dims: bool = True,
     ) -> pd.DataFrame:
+        """Join order_items against an already-filtered orders frame plus dims.
+
+        Only the surviving rows are hash-joined, so the denormalized "lines"
+        shape is materialized just for the subset a query actually touches.
+        With `dims=False` the dimension joins and derived columns are skipped
+        entirely — aggregations that only need qty/extended_price/order_id
+        never pay for columns they would not read.
+        """
+        t = self._tables
+        items = t.order_items.merge(orders_subset, left_on="order_id", right_index=True, how="inner")
+        if product_ids is not None:
+            # product_ids are small positive ints, so a dense boolean lookup
+            # turns the per-line membership test into one gather instead of a
+            # hash probe per row
+            lut = np.zeros(int(t.products.index.max()) + 1, dtype=bool)
+            lut[product_ids.to_numpy()] = True
+            items = items[lut[items["product_id"].to_numpy()]]
+        if not dims:
+            return items
         df = (
-            orders.merge(order_items, on="order_id", how="inner")
-                  .merge(products[["product_id", "product_name", "category", "brand"]], on="product_id", how="left")
-                  .merge(stores[["store_id", "store_name", "city", "region"]], on="store_id", how="left")
-                  .copy()
+            items.join(t.products[["product_name", "category", "brand"]], on="product_id")
+                 .join(t.stores[["store_name", "city", "region"]], on="store_id")
         )
-        # Ensure types
-        df["extended_price"] = df["extended_price"].astype(float)
-        df["unit_price"] = df["unit_price"].astype(float)
         # Convenience fields
         df["hour"] = df["order_ts"].dt.hour
         return df
 
-    # ---------- contract helpers ----------
+    def _filtered_orders(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str],
+    ) -> pd.DataFrame:
+        """Orders surviving the date window plus the optional store filter."""
+        orders = self._orders_window(start_ts, end_ts)
+        if store_name:
+            store_ids = self._tables.store_ids_by_name.get(store_name, [])
+            orders = orders[orders["store_id"].isin(store_ids)]
+        return orders
 
     def _filtered_lines(
         self,
@@ -173,136 +569,122 @@ class CsvDataAccess(DataAccess):
         store_name: Optional[str],
         category: Optional[str],
         product_search: Optional[str],
+        dims: bool = True,
     ) -> pd.DataFrame:
-        df = self._tables.lines
-
-        mask = (df["order_ts"] >= pd.to_datetime(start_ts)) & (df["order_ts"] <= pd.to_datetime(end_ts))
-        if store_name:
-            mask &= (df["store_name"] == store_name)
-        if category:
-            mask &= (df["category"] == category)
-        if product_search and product_search.strip():
-            s = product_search.strip().lower()
-            mask &= df["product_name"].str.lower().str.contains(s, na=False)
+        # Slice the date window off the sorted orders frame, then filter the
+        # (much smaller) remainder and join only the survivors
+        return self._join_lines(
+            self._filtered_orders(start_ts, end_ts, store_name),
+            product_ids=self._matching_product_ids(category, product_search),
+            dims=dims,
+        )
 
-        return df.loc[mask].copy()
+    def open_view(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+    ) -> CsvFilteredView:
+        """Evaluate the filter set once and return a queryable view on it."""
+        return CsvFilteredView(
+            self,
+            self._filtered_orders(start_ts, end_ts, store_name),
+            self._matching_product_ids(category, product_search),
+        )
 
     # ---------- interface implementation ----------
 
-    def get_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        min_ts = self._tables.orders["order_ts"].min()
-        max_ts = self._tables.orders["order_ts"].max()
-        # Return python datetimes
-        return (pd.to_datetime(min_ts).to_pydatetime(), pd.to_datetime(max_ts).to_pydatetime())
-
-    def list_store_opening_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        if self._tables.stores.empty:
-            return (datetime.now(), datetime.now())
-        min_ts = self._tables.stores["opened_date"].min()
-        max_ts = self._tables.stores["opened_date"].max()
-        return (pd.to_datetime(min_ts).to_pydatetime(), pd.to_datetime(max_ts).to_pydatetime())
+    def get_date_bounds(
+        self, kind: DateBoundKind = DateBoundKind.DATA
+    ) -> Union[Tuple[datetime, datetime], DateBounds]:
+        # One dispatch over precomputed bounds; order bounds double as the
+        # overall data bounds since orders span the generated date range.
+        if kind in (DateBoundKind.DATA, DateBoundKind.ORDER):
+            return self._options["date_bounds"]
+        if kind == DateBoundKind.STORE_OPENING:
+            bounds = self._options["store_open_bounds"]
+        else:  # DateBoundKind.PROMO
+            bounds = self._promo_options["bounds"]
+        return bounds if bounds is not None else (datetime.now(), datetime.now())
 
     def list_store_cities(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.stores.empty:
-            return StringList(values=[])
-        cities = self._tables.stores["city"].dropna().unique().tolist()
-        return StringList(values=sorted(cities))
+        return StringList(values=self._options["store_cities"])
 
     def list_store_regions(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.stores.empty:
-            return StringList(values=[])
-        regions = self._tables.stores["region"].dropna().unique().tolist()
-        return StringList(values=sorted(regions))
+        return StringList(values=self._options["store_regions"])
 
     def list_product_names(self) -> Union[pd.DataFrame, List[ProductResponse]]:
         if self._tables.products.empty:
             return []
         # Return as DataFrame for now, can be enhanced to return ProductResponse objects
-        return self._tables.products[["product_id", "product_name", "category", "brand"]].copy()
+        # reset_index() already yields a fresh frame; no extra copy needed
+        return self._tables.products.reset_index()[["product_id", "product_name", "category", "brand"]]
 
     def list_product_categories(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.products.empty:
-            return StringList(values=[])
-        categories = self._tables.products["category"].dropna().unique().tolist()
-        return StringList(values=sorted(categories))
+        return StringList(values=self._options["product_categories"])
 
     def list_product_brands(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.products.empty:
-            return StringList(values=[])
-        brands = self._tables.products["brand"].dropna().unique().tolist()
-        return StringList(values=sorted(brands))
+        return StringList(values=self._options["product_brands"])
 
     def list_customer_segments(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.customers.empty:
-            return StringList(values=[])
-        segments = self._tables.customers["segment"].dropna().unique().tolist()
-        return StringList(values=sorted(segments))
+        return StringList(values=self._customer_options["segments"])
 
     def list_customer_home_regions(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.customers.empty:
-            return StringList(values=[])
-        regions = self._tables.customers["home_region"].dropna().unique().tolist()
-        return StringList(values=sorted(regions))
+        return StringList(values=self._customer_options["home_regions"])
 
     def list_customer_home_cities(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.customers.empty:
-            return StringList(values=[])
-        cities = self._tables.customers["home_city"].dropna().unique().tolist()
-        return StringList(values=sorted(cities))
+        return StringList(values=self._customer_options["home_cities"])
 
     def list_promo_types(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.promotions.empty:
-            return StringList(values=[])
-        types = self._tables.promotions["promo_type"].dropna().unique().tolist()
-        return StringList(values=sorted(types))
-
-    def list_promo_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        if self._tables.promotions.empty:
-            return (datetime.now(), datetime.now())
-        min_ts = self._tables.promotions["start_date"].min()
-        max_ts = self._tables.promotions["end_date"].max()
-        return (pd.to_datetime(min_ts).to_pydatetime(), pd.to_datetime(max_ts).to_pydatetime())
+        return StringList(values=self._promo_options["types"])
 
     def list_payment_types(self) -> Union[pd.DataFrame, StringList]:
-        if self._tables.orders.empty:
-            return StringList(values=[])
-        types = self._tables.orders["payment_type"].dropna().unique().tolist()
-        return StringList(values=sorted(types))
-
-    def list_order_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        return self.get_date_bounds()
+        return StringList(values=self._options["payment_types"])
+
+    # Dropdown key -> method name for the batched entry point. The CSV
+    # backend serves each from precomputed options, so the batch is just a
+    # dict build; remote backends fuse these into one query.
+    _DROPDOWN_SOURCES = {
+        "store_cities": "list_store_cities",
+        "store_regions": "list_store_regions",
+        "product_categories": "list_product_categories",
+        "product_brands": "list_product_brands",
+        "customer_segments": "list_customer_segments",
+        "customer_home_regions": "list_customer_home_regions",
+        "customer_home_cities": "list_customer_home_cities",
+        "promo_types": "list_promo_types",
+        "payment_types": "list_payment_types",
+    }
+
+    def get_dropdowns(self, keys: List[str]) -> dict:
+        return {key: getattr(self, self._DROPDOWN_SOURCES[key])() for key in keys}
 
     def list_order_payment_types(self) -> Union[pd.DataFrame, StringList]:
         return self.list_payment_types()
 
     # Customer data queries
     def get_customers(self, filters: CustomerFilters) -> Union[pd.DataFrame, List[CustomerResponse]]:
-        if self._tables.customers.empty:
+        if self._customers.empty:
             return pd.DataFrame()
 
-        df = self._tables.customers.copy()
+        # One accumulated mask, one slice: no intermediate frame per filter.
+        df = self._customers
+        mask = None
 
         if filters.start_ts:
-            df = df[df["signup_ts"] >= filters.start_ts]
+            mask = _and(mask, df["signup_ts"] >= filters.start_ts)
         if filters.end_ts:
-            df = df[df["signup_ts"] <= filters.end_ts]
+            mask = _and(mask, df["signup_ts"] <= filters.end_ts)
         if filters.segment:
-            if isinstance(filters.segment, str):
-                df = df[df["segment"] == filters.segment]
-            else:
-                df = df[df["segment"].isin(filters.segment)]
+            mask = _and(mask, df["segment"].isin(_as_seq(filters.segment)))
         if filters.home_region:
-            if isinstance(filters.home_region, str):
-                df = df[df["home_region"] == filters.home_region]
-            else:
-                df = df[df["home_region"].isin(filters.home_region)]
+            mask = _and(mask, df["home_region"].isin(_as_seq(filters.home_region)))
         if filters.home_city:
-            if isinstance(filters.home_city, str):
-                df = df[df["home_city"] == filters.home_city]
-            else:
-                df = df[df["home_city"].isin(filters.home_city)]
+            mask = _and(mask, df["home_city"].isin(_as_seq(filters.home_city)))
 
-        return df
+        return _shape(df if mask is None else df[mask], filters)
 
     # Order data queries
     def get_orders(
@@ -314,37 +696,43 @@ class CsvDataAccess(DataAccess):
         category: Optional[str] = None,
         product_search: Optional[str] = None,
     ) -> Union[pd.DataFrame, List[OrderResponse]]:
-        df = self._tables.lines.copy()
+        # Slice the date window first, then filter the remainder and join.
+        # The mask is built only from the filters actually set, so the common
+        # date-range-only shape allocates nothing and skips straight to the join.
+        orders = self._orders_window(filters.start_ts, filters.end_ts)
+        mask = None
 
-        if filters.start_ts:
-            df = df[df["order_ts"] >= filters.start_ts]
-        if filters.end_ts:
-            df = df[df["order_ts"] <= filters.end_ts]
         if filters.store_id:
-            if isinstance(filters.store_id, int):
-                df = df[df["store_id"] == filters.store_id]
-            else:
-                df = df[df["store_id"].isin(filters.store_id)]
+            mask = _and(mask, orders["store_id"].isin(_as_seq(filters.store_id)))
         if filters.customer_id:
-            if isinstance(filters.customer_id, int):
-                df = df[df["customer_id"] == filters.customer_id]
-            else:
-                df = df[df["customer_id"].isin(filters.customer_id)]
+            mask = _and(mask, orders["customer_id"].isin(_as_seq(filters.customer_id)))
         if filters.payment_type:
-            if isinstance(filters.payment_type, str):
-                df = df[df["payment_type"] == filters.payment_type]
-            else:
-                df = df[df["payment_type"].isin(filters.payment_type)]
+            mask = _and(mask, orders["payment_type"].isin(_as_seq(filters.payment_type)))
 
         # Additional filters for backward compatibility
         if store_name:
-            df = df[df["store_name"] == store_name]
-        if category:
-            df = df[df["category"] == category]
-        if product_search and product_search.strip():
-            s = product_search.strip().lower()
-            df = df[df["product_name"].str.lower().str.contains(s, na=False)]
+            store_ids = self._tables.store_ids_by_name.get(store_name, [])
+            mask = _and(mask, orders["store_id"].isin(store_ids))
+
+        df = self._join_lines(
+            orders if mask is None else orders[mask],
+            product_ids=self._matching_product_ids(category, product_search),
+        )
 
+        return _shape(self._select_order_rows(df, limit, order_by), filters)
+
+    @staticmethod
+    def _select_order_rows(
+        df: pd.DataFrame,
+        limit: Optional[int],
+        order_by: Literal["order_ts_desc", "order_ts_asc"],
+    ) -> pd.DataFrame:
+        """Project and limit joined lines into the UI's orders table.
+
+        Lines arrive pre-sorted by order_ts (invariant kept by _load_tables),
+        so ordering and LIMIT are positional slices rather than an
+        O(N log N) sort per call.
+        """
         # Select/rename in the exact order required by the UI
         cols = [
             "order_ts", "order_id", "store_name", "city", "region",
@@ -352,154 +740,132 @@ class CsvDataAccess(DataAccess):
         ]
         df = df[cols]
 
-        asc = (order_by == "order_ts_asc")
-        df = df.sort_values("order_ts", ascending=asc)
-
-        # LIMIT (client side, since CSV)
-        if limit is not None:
-            df = df.head(int(limit))
-
-        return df.reset_index(drop=True)
+        if order_by == "order_ts_asc":
+            if limit is not None:
+                df = df.iloc[:int(limit)]
+        else:
+            df = df.iloc[-int(limit):][::-1] if limit is not None else df.iloc[::-1]
+
+        # De-categorize the returned rows so UI-side groupbys don't see the
+        # full category set; this only touches up to `limit` rows.
+        df = df.reset_index(drop=True)
+        for col in ("store_name", "city", "region", "product_name", "category"):
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(object)
+        # Rebuild the display form of the int64 order key for just these rows
+        df["order_id"] = "O" + df["order_id"].astype(str)
+        return CsvDataAccess._to_arrow_backed(df)
 
     # Order items data queries
     def get_order_items(self, filters: OrderItemsFilters) -> Union[pd.DataFrame, List[OrderItemResponse]]:
-        df = self._tables.order_items.copy()
+        df = self._tables.order_items
+        mask = None
 
         if filters.start_ts:
-            # Join with orders to get order_ts
-            orders_subset = self._tables.orders[
-                (self._tables.orders["order_ts"] >= filters.start_ts) &
-                (self._tables.orders["order_ts"] <= filters.end_ts)
-            ]["order_id"]
-            df = df[df["order_id"].isin(orders_subset)]
+            # Restrict to order_ids inside the window via the sorted orders slice
+            window = self._orders_window(filters.start_ts, filters.end_ts)
+            mask = _and(mask, df["order_id"].isin(window.index))
         if filters.end_ts:
             # Already handled above
             pass
         if filters.order_id:
-            if isinstance(filters.order_id, int):
-                df = df[df["order_id"] == filters.order_id]
-            else:
-                df = df[df["order_id"].isin(filters.order_id)]
+            mask = _and(mask, df["order_id"].isin(_as_seq(filters.order_id)))
         if filters.product_id:
-            if isinstance(filters.product_id, int):
-                df = df[df["product_id"] == filters.product_id]
-            else:
-                df = df[df["product_id"].isin(filters.product_id)]
+            mask = _and(mask, df["product_id"].isin(_as_seq(filters.product_id)))
         if filters.qty_min is not None:
-            df = df[df["qty"] >= filters.qty_min]
+            mask = _and(mask, df["qty"] >= filters.qty_min)
         if filters.qty_max is not None:
-            df = df[df["qty"] <= filters.qty_max]
+            mask = _and(mask, df["qty"] <= filters.qty_max)
         if filters.unit_price_min is not None:
-            df = df[df["unit_price"] >= filters.unit_price_min]
+            mask = _and(mask, df["unit_price"] >= filters.unit_price_min)
         if filters.unit_price_max is not None:
-            df = df[df["unit_price"] <= filters.unit_price_max]
+            mask = _and(mask, df["unit_price"] <= filters.unit_price_max)
 
-        return df
+        return _shape(df if mask is None else df[mask], filters)
 
     # Product data queries
     def get_products(self, filters: ProductFilters) -> Union[pd.DataFrame, List[ProductResponse]]:
-        df = self._tables.products.copy()
+        df = self._tables.products.reset_index()
+        mask = None
 
         if filters.category:
-            if isinstance(filters.category, str):
-                df = df[df["category"] == filters.category]
-            else:
-                df = df[df["category"].isin(filters.category)]
+            mask = _and(mask, df["category"].isin(_as_seq(filters.category)))
         if filters.brand:
-            if isinstance(filters.brand, str):
-                df = df[df["brand"] == filters.brand]
-            else:
-                df = df[df["brand"].isin(filters.brand)]
+            mask = _and(mask, df["brand"].isin(_as_seq(filters.brand)))
         if filters.price_min is not None:
-            df = df[df["base_price"] >= filters.price_min]
+            mask = _and(mask, df["base_price"] >= filters.price_min)
         if filters.price_max is not None:
-            df = df[df["base_price"] <= filters.price_max]
+            mask = _and(mask, df["base_price"] <= filters.price_max)
 
-        return df
+        return _shape(df if mask is None else df[mask], filters)
 
     # Store data queries
     def get_stores(self, filters: StoreFilters) -> Union[pd.DataFrame, List[StoreResponse]]:
-        df = self._tables.stores.copy()
+        df = self._tables.stores.reset_index()
+        mask = None
 
         if filters.region:
-            if isinstance(filters.region, str):
-                df = df[df["region"] == filters.region]
-            else:
-                df = df[df["region"].isin(filters.region)]
+            mask = _and(mask, df["region"].isin(_as_seq(filters.region)))
         if filters.city:
-            if isinstance(filters.city, str):
-                df = df[df["city"] == filters.city]
-            else:
-                df = df[df["city"].isin(filters.city)]
+            mask = _and(mask, df["city"].isin(_as_seq(filters.city)))
         if filters.store_id:
-            if isinstance(filters.store_id, int):
-                df = df[df["store_id"] == filters.store_id]
-            else:
-                df = df[df["store_id"].isin(filters.store_id)]
+            mask = _and(mask, df["store_id"].isin(_as_seq(filters.store_id)))
 
-        return df
+        return _shape(df if mask is None else df[mask], filters)
 
     # Inventory data queries
     def get_inventory(self, filters: InventoryFilters) -> Union[pd.DataFrame, List[InventoryResponse]]:
-        if self._tables.inventory.empty:
+        if self._inventory.empty:
             return pd.DataFrame()
 
-        df = self._tables.inventory.copy()
+        df = self._inventory
+        mask = None
 
         if filters.start_ts:
-            df = df[df["snapshot_ts"] >= filters.start_ts]
+            mask = _and(mask, df["snapshot_ts"] >= filters.start_ts)
         if filters.end_ts:
-            df = df[df["snapshot_ts"] <= filters.end_ts]
+            mask = _and(mask, df["snapshot_ts"] <= filters.end_ts)
         if filters.store_id:
-            if isinstance(filters.store_id, int):
-                df = df[df["store_id"] == filters.store_id]
-            else:
-                df = df[df["store_id"].isin(filters.store_id)]
+            mask = _and(mask, df["store_id"].isin(_as_seq(filters.store_id)))
         if filters.product_id:
-            if isinstance(filters.product_id, int):
-                df = df[df["product_id"] == filters.product_id]
-            else:
-                df = df[df["product_id"].isin(filters.product_id)]
+            mask = _and(mask, df["product_id"].isin(_as_seq(filters.product_id)))
         if filters.on_hand_min is not None:
-            df = df[df["on_hand"] >= filters.on_hand_min]
+            mask = _and(mask, df["on_hand"] >= filters.on_hand_min)
         if filters.on_hand_max is not None:
-            df = df[df["on_hand"] <= filters.on_hand_max]
+            mask = _and(mask, df["on_hand"] <= filters.on_hand_max)
         if filters.on_order_min is not None:
-            df = df[df["on_order"] >= filters.on_order_min]
+            mask = _and(mask, df["on_order"] >= filters.on_order_min)
         if filters.on_order_max is not None:
-            df = df[df["on_order"] <= filters.on_order_max]
+            mask = _and(mask, df["on_order"] <= filters.on_order_max)
         if filters.below_safety is not None:
-            df = df[df["below_safety"] == filters.below_safety]
+            mask = _and(mask, df["below_safety"] == filters.below_safety)
 
-        return df
+        return _shape(df if mask is None else df[mask], filters)
 
     # Promotion data queries
     def get_promotions(self, filters: PromotionFilters) -> Union[pd.DataFrame, List[PromotionResponse]]:
-        if self._tables.promotions.empty:
+        if self._promotions.empty:
             return pd.DataFrame()
 
-        df = self._tables.promotions.copy()
+        df = self._promotions
+        mask = None
 
         if filters.start_date:
-            df = df[df["start_date"] >= filters.start_date]
+            # date-typed filters; one scalar Timestamp conversion per call keeps
+            # the comparison on the columnar datetime64 path
+            mask = _and(mask, df["start_date"] >= pd.Timestamp(filters.start_date))
         if filters.end_date:
-            df = df[df["end_date"] <= filters.end_date]
+            mask = _and(mask, df["end_date"] <= pd.Timestamp(filters.end_date))
         if filters.product_id:
-            if isinstance(filters.product_id, int):
-                df = df[df["product_id"] == filters.product_id]
-            else:
-                df = df[df["product_id"].isin(filters.product_id)]
+            mask = _and(mask, df["product_id"].isin(_as_seq(filters.product_id)))
         if filters.promo_type:
-            if isinstance(filters.promo_type, str):
-                df = df[df["promo_type"] == filters.promo_type]
-            else:
-                df = df[df["promo_type"].isin(filters.promo_type)]
+            mask = _and(mask, df["promo_type"].isin(_as_seq(filters.promo_type)))
         if filters.discount_pct_min is not None:
-            df = df[df["discount_pct"] >= filters.discount_pct_min]
+            mask = _and(mask, df["discount_pct"] >= filters.discount_pct_min)
         if filters.discount_pct_max is not None:
-            df = df[df["discount_pct"] <= filters.discount_pct_max]
+            mask = _and(mask, df["discount_pct"] <= filters.discount_pct_max)
 
-        return df
+        return _shape(df if mask is None else df[mask], filters)
 
     def get_product_counts(
         self,
@@ -512,7 +878,15 @@ class CsvDataAccess(DataAccess):
         top_n: int = 25,
     ) -> Union[pd.DataFrame, List[ProductResponse]]:
         flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
+        return self._product_counts_frame(flt, slice_by, top_n)
 
+    @staticmethod
+    def _product_counts_frame(
+        flt: pd.DataFrame,
+        slice_by: Optional[Literal["store", "category", "hour"]],
+        top_n: int,
+    ) -> pd.DataFrame:
+        """Aggregate already-filtered lines into the product-count frame."""
         if flt.empty:
             if slice_by:
                 return pd.DataFrame(columns=["slice_key", "product_name", "item_count"])
@@ -521,17 +895,18 @@ class CsvDataAccess(DataAccess):
 
         if slice_by is None:
             agg = (
-                flt.groupby("product_name", as_index=False)["qty"]
+                flt.groupby("product_name", as_index=False, observed=True, sort=False)["qty"]
                    .sum()
                    .rename(columns={"qty": "item_count"})
                    .sort_values("item_count", ascending=False)
                    .head(int(top_n))
             )
-            return agg.reset_index(drop=True)
+            agg["product_name"] = agg["product_name"].astype(object)
+            return CsvDataAccess._to_arrow_backed(agg.reset_index(drop=True))
 
         # With slicing: pick top-N products overall, then return long form by slice
         overall = (
-            flt.groupby("product_name", as_index=False)["qty"]
+            flt.groupby("product_name", as_index=False, observed=True, sort=False)["qty"]
                .sum()
                .rename(columns={"qty": "item_count"})
                .sort_values("item_count", ascending=False)
@@ -544,15 +919,112 @@ class CsvDataAccess(DataAccess):
 
         sliced = (
             flt[flt["product_name"].isin(top_products)]
-            .groupby([key_col, "product_name"], as_index=False)["qty"]
+            .groupby([key_col, "product_name"], as_index=False, observed=True, sort=False)["qty"]
             .sum()
             .rename(columns={"qty": "item_count"})
         )
         sliced = sliced.rename(columns={key_col: "slice_key"})
-        return sliced.reset_index(drop=True)
+        # De-categorize the tiny result frame so downstream pivots/charts don't
+        # inherit the full category set
+        for col in ("slice_key", "product_name"):
+            if isinstance(sliced[col].dtype, pd.CategoricalDtype):
+                sliced[col] = sliced[col].astype(object)
+        return CsvDataAccess._to_arrow_backed(sliced.reset_index(drop=True))
+
+    # ---------- Secondary chart aggregations ----------
+    # These run over the full filtered set, unlike the old client-side
+    # groupbys in app.py which silently depended on the orders row limit.
+
+    @staticmethod
+    def _orders_over_time_frame(flt: pd.DataFrame) -> pd.DataFrame:
+        """Distinct orders and revenue per hour bucket of order_ts.
+
+        Groups on the order_hour column precomputed at load, so no per-call
+        dt.floor pass over the filtered rows.
+        """
+        ts = (
+            flt.groupby("order_hour", as_index=False)
+               .agg(orders=("order_id", "nunique"), revenue=("extended_price", "sum"))
+               .sort_values("order_hour")
+        )
+        return CsvDataAccess._to_arrow_backed(ts.reset_index(drop=True))
+
+    @staticmethod
+    def _revenue_by_region_frame(flt: pd.DataFrame) -> pd.DataFrame:
+        """Revenue per store region, highest first."""
+        out = (
+            flt.groupby("region", as_index=False, observed=True)["extended_price"].sum()
+               .rename(columns={"extended_price": "revenue"})
+               .sort_values("revenue", ascending=False)
+        )
+        if isinstance(out["region"].dtype, pd.CategoricalDtype):
+            out["region"] = out["region"].astype(object)
+        return CsvDataAccess._to_arrow_backed(out.reset_index(drop=True))
+
+    @staticmethod
+    def _top_products_by_revenue_frame(flt: pd.DataFrame, top_n: int) -> pd.DataFrame:
+        """Top-N products by revenue, highest first."""
+        out = (
+            flt.groupby("product_name", as_index=False, observed=True)["extended_price"].sum()
+               .rename(columns={"extended_price": "revenue"})
+               .sort_values("revenue", ascending=False)
+               .head(int(top_n))
+        )
+        out["product_name"] = out["product_name"].astype(object)
+        return CsvDataAccess._to_arrow_backed(out.reset_index(drop=True))
+
+    def get_orders_over_time(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get distinct orders and revenue per hour for the current filter set."""
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search, dims=False)
+        return self._orders_over_time_frame(flt)
+
+    def get_revenue_by_region(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get revenue per region for the current filter set."""
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
+        return self._revenue_by_region_frame(flt)
+
+    def get_top_products_by_revenue(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+        top_n: int = 10,
+    ) -> pd.DataFrame:
+        """Get the top-N products by revenue for the current filter set."""
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
+        return self._top_products_by_revenue_frame(flt, top_n)
 
     # ---------- Individual KPI methods (replacing KpiTotals) ----------
 
+    @staticmethod
+    def _distinct_count(values: pd.Series) -> int:
+        """Count distinct values via sort + neighbor-diff on the raw array.
+
+        Avoids the hash table pd.Series.nunique builds; on the contiguous
+        arrays the KPI paths produce this is a plain memory scan.
+        """
+        arr = values.to_numpy()
+        if arr.size == 0:
+            return 0
+        arr = np.sort(arr)
+        return 1 + int(np.count_nonzero(arr[1:] != arr[:-1]))
+
     def get_orders_distinct_count(
         self,
         start_ts: datetime,
@@ -562,8 +1034,8 @@ class CsvDataAccess(DataAccess):
         product_search: Optional[str] = None,
     ) -> int:
         """Get distinct order count for the current filter set."""
-        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
-        return int(flt["order_id"].nunique())
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search, dims=False)
+        return self._distinct_count(flt["order_id"])
 
     def get_order_lines_count(
         self,
@@ -574,7 +1046,7 @@ class CsvDataAccess(DataAccess):
         product_search: Optional[str] = None,
     ) -> int:
         """Get total order lines count for the current filter set."""
-        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search, dims=False)
         return int(len(flt))
 
     def get_total_units(
@@ -586,8 +1058,8 @@ class CsvDataAccess(DataAccess):
         product_search: Optional[str] = None,
     ) -> int:
         """Get total units sold for the current filter set."""
-        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
-        return int(flt["qty"].sum()) if not flt.empty else 0
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search, dims=False)
+        return int(flt["qty"].to_numpy().sum()) if not flt.empty else 0
 
     def get_total_revenue(
         self,
@@ -598,8 +1070,8 @@ class CsvDataAccess(DataAccess):
         product_search: Optional[str] = None,
     ) -> float:
         """Get total revenue for the current filter set."""
-        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search)
-        return float(flt["extended_price"].sum()) if not flt.empty else 0.0
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search, dims=False)
+        return float(flt["extended_price"].to_numpy().sum(dtype=np.float64)) if not flt.empty else 0.0
 
     # ---------- Legacy methods for backward compatibility ----------
 
@@ -626,11 +1098,21 @@ class CsvDataAccess(DataAccess):
         store_name: Optional[str] = None,
         category: Optional[str] = None,
         product_search: Optional[str] = None,
-    ) -> dict:
-        """Legacy method - use individual KPI methods instead."""
-        return {
-            "orders_distinct": self.get_orders_distinct_count(start_ts, end_ts, store_name, category, product_search),
-            "lines": self.get_order_lines_count(start_ts, end_ts, store_name, category, product_search),
-            "units": self.get_total_units(start_ts, end_ts, store_name, category, product_search),
-            "revenue": self.get_total_revenue(start_ts, end_ts, store_name, category, product_search),
-        }
+    ) -> KpiTotals:
+        """Legacy method - use individual KPI methods instead.
+
+        Filters once and computes all four aggregates from the same subset,
+        instead of paying the filter+join cost per KPI.
+        """
+        flt = self._filtered_lines(start_ts, end_ts, store_name, category, product_search, dims=False)
+        return self._kpis_from_items(flt)
+
+    @staticmethod
+    def _kpis_from_items(flt: pd.DataFrame) -> KpiTotals:
+        """All four KPI aggregates from one already-filtered items frame."""
+        return KpiTotals(
+            orders_distinct=CsvDataAccess._distinct_count(flt["order_id"]),
+            lines=int(len(flt)),
+            units=int(flt["qty"].to_numpy().sum()) if not flt.empty else 0,
+            revenue=float(flt["extended_price"].to_numpy().sum(dtype=np.float64)) if not flt.empty else 0.0,
+        )
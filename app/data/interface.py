@@ -2,59 +2,125 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Optional, Protocol, Tuple, Union, List
-
-import pandas as pd
-from pydantic import BaseModel
-
-from .models import (
-    # Filter classes
-    CustomerFilters,
-    OrderFilters,
-    OrderItemsFilters,
-    ProductFilters,
-    StoreFilters,
-    InventoryFilters,
-    PromotionFilters,
-    # Response models
-    CustomerResponse,
-    ProductResponse,
-    StoreResponse,
-    OrderResponse,
-    OrderItemResponse,
-    InventoryResponse,
-    PromotionResponse,
-    # List response models
-    StringList,
-    IntList,
-    DateTimeList,
-    DateBounds,
-)
+from enum import Enum
+from typing import TYPE_CHECKING, Literal, NamedTuple, Optional, Protocol, Tuple, Union, List
+
+if TYPE_CHECKING:
+    # Annotation-only imports: with postponed evaluation the hints below are
+    # never resolved at runtime, so importing this module stays free of the
+    # pandas/pydantic import cost.
+    import pandas as pd
+
+    from .models import (
+        # Filter classes
+        CustomerFilters,
+        OrderFilters,
+        OrderItemsFilters,
+        ProductFilters,
+        StoreFilters,
+        InventoryFilters,
+        PromotionFilters,
+        # Response models
+        CustomerResponse,
+        ProductResponse,
+        StoreResponse,
+        OrderResponse,
+        OrderItemResponse,
+        InventoryResponse,
+        PromotionResponse,
+        # List response models
+        StringList,
+        IntList,
+        DateTimeList,
+        DateBounds,
+    )
 
 
 # ---- Types returned to the UI ----
 
 
+class KpiTotals(NamedTuple):
+    """The four headline aggregates for one filter set.
+
+    A NamedTuple, not a Pydantic model: the values are backend-computed
+    aggregates with nothing to validate, and this is rebuilt on every
+    filter change.
+    """
+    orders_distinct: int
+    lines: int
+    units: int
+    revenue: float
+
+
+class DateBoundKind(str, Enum):
+    """Which MIN/MAX timestamp pair get_date_bounds should report."""
+    DATA = "data"
+    ORDER = "order"
+    STORE_OPENING = "store_opening"
+    PROMO = "promo"
+
 
 # ---- Data access protocol ----
 
-class DataAccess(Protocol):
+class FilteredView(Protocol):
+    """One evaluated filter set shared by several queries.
+
+    Obtained from DataAccess.open_view(). The backend evaluates the filters a
+    single time; KPIs, order rows and product counts are then derived from the
+    same result set without re-filtering.
     """
-    Backend-agnostic contract for the Streamlit UI.
 
-    IMPORTANT for latency demo:
-    - Implementations MUST avoid result caching inside these methods.
-      Each call should execute a fresh query against the underlying source.
+    def kpis(self) -> KpiTotals:
+        """All four KPI aggregates for the view's filter set."""
+        ...
+
+    def orders(
+        self,
+        limit: int = 2000,
+        order_by: Literal["order_ts_desc", "order_ts_asc"] = "order_ts_desc",
+    ) -> pd.DataFrame:
+        """The orders table rows for the view's filter set."""
+        ...
+
+    def product_counts(
+        self,
+        slice_by: Optional[Literal["store", "category", "hour"]] = None,
+        top_n: int = 25,
+    ) -> pd.DataFrame:
+        """Product counts (optionally sliced) for the view's filter set."""
+        ...
+
+    def orders_over_time(self) -> pd.DataFrame:
+        """Distinct orders and revenue per hour for the view's filter set."""
+        ...
+
+    def revenue_by_region(self) -> pd.DataFrame:
+        """Revenue per region for the view's filter set."""
+        ...
+
+    def top_products_by_revenue(self, top_n: int = 10) -> pd.DataFrame:
+        """Top-N products by revenue for the view's filter set."""
+        ...
+
+
+class DimensionAccess(Protocol):
+    """Metadata lookups: dropdown option lists and date bounds.
+
+    These read small dimension tables, so backends MAY cache or serve them
+    from materialized views; staleness here only affects filter choices.
     """
 
     # Queries to populate dropdowns and filters
 
-    def get_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        """Get the start and end date for the data."""
-        ...
+    def get_date_bounds(
+        self, kind: DateBoundKind = DateBoundKind.DATA
+    ) -> Union[Tuple[datetime, datetime], DateBounds]:
+        """Get the (start, end) timestamps for the requested bound kind.
 
-    def list_store_opening_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        """Get the start and end date for the store opening dates."""
+        One parameterized member instead of a method per table/column pair;
+        SQL backends can serve every kind from a single prepared statement
+        keyed on the enum.
+        """
         ...
 
     def list_store_cities(self) -> Union[pd.DataFrame, StringList]:
@@ -93,22 +159,32 @@ class DataAccess(Protocol):
         """List all promotion types."""
         ...
 
-    def list_promo_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        """Get the start and end date for the promotion dates."""
-        ...
-
     def list_payment_types(self) -> Union[pd.DataFrame, StringList]:
         """List all payment types."""
         ...
 
-    def list_order_date_bounds(self) -> Union[Tuple[datetime, datetime], DateBounds]:
-        """Get the start and end date for the order dates."""
-        ...
-
     def list_order_payment_types(self) -> Union[pd.DataFrame, StringList]:
         """List all order payment types."""
         ...
 
+    def get_dropdowns(self, keys: List[str]) -> dict:
+        """Batch several dropdown option lists into one backend round trip.
+
+        Keys name the option lists (e.g. "store_cities", "payment_types");
+        the result maps each key to the same value its list_* method returns.
+        Remote backends should satisfy the whole batch with a single query.
+        """
+        ...
+
+
+class FactAccess(Protocol):
+    """Fact-table queries driving the latency demo.
+
+    IMPORTANT for latency demo:
+    - Implementations MUST avoid result caching inside these methods.
+      Each call should execute a fresh query against the underlying source.
+    """
+
     # Customer data queries
     def get_customers(self, filters: CustomerFilters) -> Union[pd.DataFrame, List[CustomerResponse]]:
         """Get customers based on filters."""
@@ -149,6 +225,17 @@ class DataAccess(Protocol):
         """Get promotions based on filters."""
         ...
 
+    def open_view(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+    ) -> FilteredView:
+        """Evaluate the filter set once and return a queryable view on it."""
+        ...
+
     def get_product_counts(
         self,
         start_ts: datetime,
@@ -161,3 +248,51 @@ class DataAccess(Protocol):
     ) -> Union[pd.DataFrame, List[ProductResponse]]:
         """Get product counts with optional slicing."""
         ...
+
+    def get_orders_over_time(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get distinct orders and revenue per hour for the filter set."""
+        ...
+
+    def get_revenue_by_region(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get revenue per region for the filter set."""
+        ...
+
+    def get_top_products_by_revenue(
+        self,
+        start_ts: datetime,
+        end_ts: datetime,
+        store_name: Optional[str] = None,
+        category: Optional[str] = None,
+        product_search: Optional[str] = None,
+        top_n: int = 10,
+    ) -> pd.DataFrame:
+        """Get the top-N products by revenue for the filter set."""
+        ...
+
+
+class DataAccess(FactAccess, DimensionAccess, Protocol):
+    """
+    Backend-agnostic contract for the Streamlit UI.
+
+    The split bases scope the caching rules: FactAccess queries must hit the
+    source fresh on every call, DimensionAccess lookups may be cached.
+
+    This Protocol is deliberately NOT @runtime_checkable: with this many
+    members an isinstance() check does a per-method attribute scan via
+    _ProtocolMeta. Rely on static typing; if a call site must probe at
+    runtime, use a cheap hasattr(obj, "get_orders") instead.
+    """
@@ -1,4 +1,5 @@
 from .data_filters import (
+    FilterSet,
     CustomerFilters,
     OrderFilters,
     OrderItemsFilters,
@@ -8,6 +9,8 @@ from .data_filters import (
     PromotionFilters,
 )
 
+from .enums import Segment, Region, PaymentType, PromoType
+
 from .customers import CustomerResponse
 from .products import ProductResponse
 from .stores import StoreResponse
@@ -24,6 +27,7 @@ from .list_response import (
 
 __all__ = [
     # Filter classes
+    "FilterSet",
     "CustomerFilters",
     "OrderFilters",
     "OrderItemsFilters",
@@ -31,6 +35,11 @@ __all__ = [
     "StoreFilters",
     "InventoryFilters",
     "PromotionFilters",
+    # Categorical enums
+    "Segment",
+    "Region",
+    "PaymentType",
+    "PromoType",
     # Response models
     "CustomerResponse",
     "ProductResponse",
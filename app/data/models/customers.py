@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .enums import Region, Segment
 
 
 class CustomerResponse(BaseModel):
     """Response model for customer data."""
+    model_config = ConfigDict(frozen=True)
     customer_id: int = Field(description="Unique customer identifier")
-    segment: Literal["loyal", "casual", "bargain", "premium"] = Field(description="Customer loyalty segment")
+    segment: Segment = Field(description="Customer loyalty segment")
     signup_ts: datetime = Field(description="Customer signup timestamp")
-    home_region: Literal["West", "Central", "East"] = Field(description="Customer's home region")
+    home_region: Region = Field(description="Customer's home region")
     home_city: str = Field(description="Customer's home city")
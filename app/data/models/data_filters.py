@@ -1,64 +1,162 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Annotated, Any, ClassVar, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 
-class CustomerFilters(BaseModel):
+def _ensure_list(v):
+    """Wrap a bare scalar into a one-element list; None and lists pass through."""
+    if v is None or isinstance(v, list):
+        return v
+    return [v]
+
+
+# Scalar-or-list filter fields, normalized to a list at validation time so
+# backends see one canonical shape (always the isin/IN path, no type branch).
+StrFilter = Annotated[Optional[List[str]], BeforeValidator(_ensure_list)]
+IntFilter = Annotated[Optional[List[int]], BeforeValidator(_ensure_list)]
+
+
+class FilterSet(BaseModel):
+    """Base class for filter models with a declarative predicate descriptor.
+
+    Each subclass lists its predicates once as (field_name, column_name, op)
+    tuples in ``__predicates__``. Backends iterate :meth:`to_predicates` and
+    emit one clause per entry instead of maintaining a per-field
+    ``if x is not None`` ladder. Fields with non-column semantics (e.g.
+    ``below_safety``) are left out of the descriptor and handled explicitly.
+
+    ``__mv_key__`` names a materialized view a backend MAY serve dimension
+    lookups (dropdown values, bounds) from instead of the live table, with
+    ``__mv_ttl_seconds__`` bounding acceptable staleness. This only covers
+    metadata queries; the no-caching contract on the fact get_* paths in
+    DataAccess stands. Backends without MVs ignore both.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    __predicates__: ClassVar[List[Tuple[str, str, str]]] = []
+    __mv_key__: ClassVar[Optional[str]] = None
+    __mv_ttl_seconds__: ClassVar[int] = 3600
+
+    columns: Optional[List[str]] = Field(default=None, description="Project only these columns in the result")
+    limit: Optional[int] = Field(default=None, description="Return at most this many rows")
+    offset: Optional[int] = Field(default=None, description="Skip this many rows before applying the limit")
+
+    def to_predicates(self) -> List[Tuple[str, str, Any]]:
+        """Return (column, op, value) tuples for every field that is set."""
+        return [
+            (column, op, value)
+            for field, column, op in self.__predicates__
+            if (value := getattr(self, field)) is not None
+        ]
+
+
+class CustomerFilters(FilterSet):
     """Filters for the customer data."""
+    __mv_key__ = "mv_customer_dropdowns"
+    __predicates__ = [
+        ("start_ts", "signup_ts", ">="),
+        ("end_ts", "signup_ts", "<="),
+        ("segment", "segment", "IN"),
+        ("home_region", "home_region", "IN"),
+        ("home_city", "home_city", "IN"),
+    ]
     start_ts: Optional[datetime] = Field(default=None, description="Start timestamp for signup date range")
     end_ts: Optional[datetime] = Field(default=None, description="End timestamp for signup date range")
-    segment: Optional[str | list[str]] = Field(default=None, description="Segment filter (single segment or list of segments)")
-    home_region: Optional[str | list[str]] = Field(default=None, description="Home region filter (single region or list of regions)")
-    home_city: Optional[str | list[str]] = Field(default=None, description="Home city filter (single city or list of cities)")
+    segment: StrFilter = Field(default=None, description="Segment filter (single segment or list of segments)")
+    home_region: StrFilter = Field(default=None, description="Home region filter (single region or list of regions)")
+    home_city: StrFilter = Field(default=None, description="Home city filter (single city or list of cities)")
 
 
-class OrderFilters(BaseModel):
+class OrderFilters(FilterSet):
     """Filters for the order data."""
+    __predicates__ = [
+        ("start_ts", "order_ts", ">="),
+        ("end_ts", "order_ts", "<="),
+        ("store_id", "store_id", "IN"),
+        ("customer_id", "customer_id", "IN"),
+        ("payment_type", "payment_type", "IN"),
+        ("discount_pct_min", "discount_pct", ">="),
+        ("discount_pct_max", "discount_pct", "<="),
+    ]
     start_ts: Optional[datetime] = Field(default=None, description="Start timestamp for order date range")
     end_ts: Optional[datetime] = Field(default=None, description="End timestamp for order date range")
-    store_id: Optional[int | list[int]] = Field(default=None, description="Store ID filter (single store or list of stores)")
-    customer_id: Optional[int | list[int]] = Field(default=None, description="Customer ID filter (single customer or list of customers)")
-    payment_type: Optional[str | list[str]] = Field(default=None, description="Payment type filter (single type or list of types)")
+    store_id: IntFilter = Field(default=None, description="Store ID filter (single store or list of stores)")
+    customer_id: IntFilter = Field(default=None, description="Customer ID filter (single customer or list of customers)")
+    payment_type: StrFilter = Field(default=None, description="Payment type filter (single type or list of types)")
     discount_pct_min: Optional[float] = Field(default=0.0, description="Minimum discount percentage")
     discount_pct_max: Optional[float] = Field(default=1.0, description="Maximum discount percentage")
 
 
-class OrderItemsFilters(BaseModel):
+class OrderItemsFilters(FilterSet):
     """Filters for the order items data."""
+    __predicates__ = [
+        ("start_ts", "order_ts", ">="),
+        ("end_ts", "order_ts", "<="),
+        ("order_id", "order_id", "IN"),
+        ("product_id", "product_id", "IN"),
+        ("qty_min", "qty", ">="),
+        ("qty_max", "qty", "<="),
+        ("unit_price_min", "unit_price", ">="),
+        ("unit_price_max", "unit_price", "<="),
+    ]
     start_ts: Optional[datetime] = Field(default=None, description="Start timestamp for order date range")
     end_ts: Optional[datetime] = Field(default=None, description="End timestamp for order date range")
-    order_id: Optional[int | list[int]] = Field(default=None, description="Order ID filter (single int or list of ints)")
-    product_id: Optional[int | list[int]] = Field(default=None, description="Product ID filter (single int or list of ints)")
+    order_id: IntFilter = Field(default=None, description="Order ID filter (single int or list of ints)")
+    product_id: IntFilter = Field(default=None, description="Product ID filter (single int or list of ints)")
     qty_min: Optional[int] = Field(default=0, description="Minimum quantity")
     qty_max: Optional[int] = Field(default=1000, description="Maximum quantity")
     unit_price_min: Optional[float] = Field(default=0.0, description="Minimum unit price")
     unit_price_max: Optional[float] = Field(default=1000.0, description="Maximum unit price")
 
 
-class ProductFilters(BaseModel):
+class ProductFilters(FilterSet):
     """Filters for the product data."""
-    category: Optional[str | list[str]] = Field(default=None, description="Category filter (single category or list of categories)")
-    brand: Optional[str | list[str]] = Field(default=None, description="Brand filter (single brand or list of brands)")
+    __mv_key__ = "mv_product_dropdowns"
+    __predicates__ = [
+        ("category", "category", "IN"),
+        ("brand", "brand", "IN"),
+        ("price_min", "base_price", ">="),
+        ("price_max", "base_price", "<="),
+    ]
+    category: StrFilter = Field(default=None, description="Category filter (single category or list of categories)")
+    brand: StrFilter = Field(default=None, description="Brand filter (single brand or list of brands)")
     price_min: Optional[float] = Field(default=0.0, description="Minimum price")
     price_max: Optional[float] = Field(default=1000.0, description="Maximum price")
 
 
-class StoreFilters(BaseModel):
+class StoreFilters(FilterSet):
     """Filters for the store data."""
-    region: Optional[str | list[str]] = Field(default=None, description="Region filter (single region or list of regions)")
-    city: Optional[str | list[str]] = Field(default=None, description="City filter (single city or list of cities)")
-    store_id: Optional[int | list[int]] = Field(default=None, description="Store ID filter (single store or list of stores)")
-
-
-class InventoryFilters(BaseModel):
+    __mv_key__ = "mv_store_dropdowns"
+    __predicates__ = [
+        ("region", "region", "IN"),
+        ("city", "city", "IN"),
+        ("store_id", "store_id", "IN"),
+    ]
+    region: StrFilter = Field(default=None, description="Region filter (single region or list of regions)")
+    city: StrFilter = Field(default=None, description="City filter (single city or list of cities)")
+    store_id: IntFilter = Field(default=None, description="Store ID filter (single store or list of stores)")
+
+
+class InventoryFilters(FilterSet):
     """Filters for the inventory snapshot data."""
+    # below_safety compares two columns and is handled by the backend directly.
+    __predicates__ = [
+        ("start_ts", "snapshot_ts", ">="),
+        ("end_ts", "snapshot_ts", "<="),
+        ("store_id", "store_id", "IN"),
+        ("product_id", "product_id", "IN"),
+        ("on_hand_min", "on_hand", ">="),
+        ("on_hand_max", "on_hand", "<="),
+        ("on_order_min", "on_order", ">="),
+        ("on_order_max", "on_order", "<="),
+    ]
     start_ts: Optional[datetime] = Field(default=None, description="Start timestamp for inventory snapshot range")
     end_ts: Optional[datetime] = Field(default=None, description="End timestamp for inventory snapshot range")
-    store_id: Optional[int | list[int]] = Field(default=None, description="Store ID filter (single store or list of stores)")
-    product_id: Optional[int | list[int]] = Field(default=None, description="Product ID filter (single product or list of products)")
+    store_id: IntFilter = Field(default=None, description="Store ID filter (single store or list of stores)")
+    product_id: IntFilter = Field(default=None, description="Product ID filter (single product or list of products)")
     on_hand_min: Optional[int] = Field(default=0, description="Minimum on-hand quantity")
     on_hand_max: Optional[int] = Field(default=1000, description="Maximum on-hand quantity")
     on_order_min: Optional[int] = Field(default=0, description="Minimum on-order quantity")
@@ -66,11 +164,20 @@ class InventoryFilters(BaseModel):
     below_safety: Optional[bool] = Field(default=None, description="Filter for items below safety stock")
 
 
-class PromotionFilters(BaseModel):
+class PromotionFilters(FilterSet):
     """Filters for the promotion data."""
-    start_date: Optional[datetime] = Field(default=None, description="Start date for promotion range")
-    end_date: Optional[datetime] = Field(default=None, description="End date for promotion range")
-    product_id: Optional[int | list[int]] = Field(default=None, description="Product ID filter (single product or list of products)")
-    promo_type: Optional[str | list[str]] = Field(default=None, description="Promotion type filter (single type or list of types)")
+    __mv_key__ = "mv_promo_dropdowns"
+    __predicates__ = [
+        ("start_date", "start_date", ">="),
+        ("end_date", "end_date", "<="),
+        ("product_id", "product_id", "IN"),
+        ("promo_type", "promo_type", "IN"),
+        ("discount_pct_min", "discount_pct", ">="),
+        ("discount_pct_max", "discount_pct", "<="),
+    ]
+    start_date: Optional[date] = Field(default=None, description="Start date for promotion range")
+    end_date: Optional[date] = Field(default=None, description="End date for promotion range")
+    product_id: IntFilter = Field(default=None, description="Product ID filter (single product or list of products)")
+    promo_type: StrFilter = Field(default=None, description="Promotion type filter (single type or list of types)")
     discount_pct_min: Optional[float] = Field(default=0.0, description="Minimum discount percentage")
     discount_pct_max: Optional[float] = Field(default=1.0, description="Maximum discount percentage")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class LabeledIntEnum(IntEnum):
+    """IntEnum whose members validate from and render as their string label.
+
+    Categorical response fields store a one-byte code per row instead of a
+    Python string. Member names map 1:1 to the data labels, with ``_``
+    standing in for ``-`` (identifier rules); fields typed with these accept
+    either the label or the code, and str() renders the label for the UI.
+    """
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.replace("-", "_"))
+        return None
+
+    def __str__(self) -> str:
+        return self.name.replace("_", "-")
+
+
+class Segment(LabeledIntEnum):
+    loyal = 0
+    casual = 1
+    bargain = 2
+    premium = 3
+
+
+class Region(LabeledIntEnum):
+    West = 0
+    Central = 1
+    East = 2
+
+
+class PaymentType(LabeledIntEnum):
+    card = 0
+    cash = 1
+    mobile = 2
+
+
+class PromoType(LabeledIntEnum):
+    BOGO_lite = 0
+    PercentOff = 1
+    PriceDrop = 2
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class InventoryResponse(BaseModel):
     """Response model for inventory snapshot data."""
+    model_config = ConfigDict(frozen=True)
     snapshot_ts: datetime = Field(description="Inventory snapshot timestamp")
     store_id: int = Field(description="Store identifier")
     product_id: int = Field(description="Product identifier")
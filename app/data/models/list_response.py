@@ -1,27 +1,30 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import Generic, List, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+T = TypeVar("T")
 
-class StringList(BaseModel):
-    """Generic container for lists of unique string values."""
-    values: List[str] = Field(description="List of unique string values")
 
+class ValueList(BaseModel, Generic[T]):
+    """Generic container for lists of unique values.
 
-class IntList(BaseModel):
-    """Generic container for lists of unique integer values."""
-    values: List[int] = Field(description="List of unique integer values")
+    One parametric model instead of a near-identical class per element type;
+    Pydantic compiles each parametrization lazily on first use.
+    """
+    model_config = ConfigDict(frozen=True)
+    values: List[T] = Field(description="List of unique values")
 
 
-class DateTimeList(BaseModel):
-    """Generic container for lists of unique datetime values."""
-    values: List[datetime] = Field(description="List of unique datetime values")
+StringList = ValueList[str]
+IntList = ValueList[int]
+DateTimeList = ValueList[datetime]
 
 
 class DateBounds(BaseModel):
     """Response model for date bounds data."""
+    model_config = ConfigDict(frozen=True)
     start_ts: datetime = Field(description="Start timestamp")
     end_ts: datetime = Field(description="End timestamp")
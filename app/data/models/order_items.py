@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OrderItemResponse(BaseModel):
-    """Response model for order item data."""
-    order_id: str = Field(description="Order identifier this item belongs to")
+    """Response model for order item data.
+
+    The float annotations are Python-level; backends store the price columns
+    as float32 (2-decimal retail prices need no more) so bulk DataFrame
+    results stream half the bytes.
+
+    extended_price (qty * unit_price) is materialized at ingest, not derived
+    per query: the generator writes it and the Parquet sidecars carry it with
+    column statistics, so revenue KPIs are a single column reduction and
+    price predicates can prune on row-group min/max.
+    """
+    model_config = ConfigDict(frozen=True)
+    order_id: int = Field(description="Numeric order key this item belongs to (display form is 'O' + key)")
     line_number: int = Field(description="Line number within the order")
     product_id: int = Field(description="Product identifier")
     qty: int = Field(description="Quantity ordered")
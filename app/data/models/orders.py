@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .enums import PaymentType
 
 
 class OrderResponse(BaseModel):
     """Response model for order data."""
-    order_id: str = Field(description="Unique order identifier")
+    model_config = ConfigDict(frozen=True)
+    order_id: int = Field(description="Numeric order key (display form is 'O' + key)")
     store_id: int = Field(description="Store where order was placed")
     customer_id: int = Field(description="Customer who placed the order")
     order_ts: datetime = Field(description="Order timestamp")
-    payment_type: Literal["card", "cash", "mobile"] = Field(description="Payment method used")
+    payment_type: PaymentType = Field(description="Payment method used")
     discount_pct: float = Field(description="Discount percentage applied")
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProductResponse(BaseModel):
     """Response model for product data."""
+    model_config = ConfigDict(frozen=True)
     product_id: int = Field(description="Unique product identifier")
     sku: str = Field(description="Stock keeping unit code")
     name: str = Field(description="Product name")
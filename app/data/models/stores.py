@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .enums import Region
 
 
 class StoreResponse(BaseModel):
     """Response model for store data."""
+    model_config = ConfigDict(frozen=True)
     store_id: int = Field(description="Unique store identifier")
     name: str = Field(description="Store name")
-    region: Literal["West", "Central", "East"] = Field(description="Store region")
+    region: Region = Field(description="Store region")
     city: str = Field(description="Store city")
     latitude: float = Field(description="Store latitude coordinate")
     longitude: float = Field(description="Store longitude coordinate")
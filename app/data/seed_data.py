@@ -14,16 +14,19 @@ Run:
 
 from __future__ import annotations
 import argparse
-import csv
 import os
-import random
 import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, date, time, timezone
-from math import ceil, sin, pi
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
 # Import config for default output directory
 try:
     from ..config import get_config
@@ -40,6 +43,12 @@ except ImportError:
 # Config & helper structures
 # -----------------------------
 
+# Generated tables are struct-of-arrays: one equal-length column per field.
+# Columns are plain lists or numpy arrays; a dict per row costs ~200-300 B of
+# object overhead and a per-row key hash at CSV-write time, so rows are only
+# ever materialized as tuples while streaming to disk.
+Table = Dict[str, list]
+
 REGIONS = ["West", "Central", "East"]
 CITIES_BY_REGION = {
     "West": ["Vancouver", "Seattle", "Portland", "San Francisco", "San Jose", "Calgary"],
@@ -58,6 +67,15 @@ CATEGORIES = {
 }
 
 PAYMENT_TYPES = ["card", "cash", "mobile"]
+SEGMENTS = ["casual", "loyal", "bargain", "premium"]
+
+# NumPy views of the categorical vocabularies: per-row values are drawn as
+# small integer codes and materialized with a single gather per column,
+# instead of building one Python string per row.
+REGION_NAMES = np.array(REGIONS)
+CITY_NAMES = np.array([CITIES_BY_REGION[r] for r in REGIONS])  # (region, city)
+PAYMENT_NAMES = np.array(PAYMENT_TYPES)
+SEGMENT_NAMES = np.array(SEGMENTS)
 
 PROMO_TYPES = ["BOGO-lite", "PercentOff", "PriceDrop"]
 
@@ -83,40 +101,48 @@ def ensure_dir(path: str) -> None:
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
 
-def rand_sku() -> str:
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+def rand_skus(n: int, rng: np.random.Generator) -> List[str]:
+    """Generate `n` random 8-char SKUs in one vectorized draw.
+
+    Indexes a byte alphabet with an (n, 8) code matrix and views the result as
+    fixed-width strings — no per-SKU join/choices round-trip.
+    """
+    alpha = np.frombuffer((string.ascii_uppercase + string.digits).encode(), dtype="|S1")
+    codes = rng.integers(0, len(alpha), size=(n, 8), dtype=np.uint8)
+    return alpha[codes].view("|S8").ravel().astype(str).tolist()
 
-def zipf_like_index(n: int, s: float = 1.15) -> int:
+def zipf_like_indices(n: int, size: int, rng: np.random.Generator, s: float = 1.15) -> np.ndarray:
     """
-    Return a product index [0, n-1] with a bias toward lower indices (popular items).
+    Return `size` product indices [0, n-1] with a bias toward lower indices (popular items).
     s ~1.0-1.3 controls skew.
     """
-    # Invert a Pareto-ish draw to an index
-    r = random.random()
-    # Normalize using harmonic approximation; simple monotonic mapping:
-    idx = int((r ** (1.0 / (1.0 + s))) * n)
-    if idx >= n:
-        idx = n - 1
-    return idx
-
-def diurnal_multiplier(ts: datetime) -> float:
+    # Invert a Pareto-ish draw to an index; the closed-form inverse transform
+    # is evaluated for the whole batch in one vectorized call instead of a
+    # Python random()+pow round-trip per line item
+    r = rng.random(size)
+    idx = (r ** (1.0 / (1.0 + s)) * n).astype(np.int64)
+    return np.minimum(idx, n - 1)
+
+def diurnal_multiplier(ts: np.ndarray) -> np.ndarray:
     """
     Smooth midday/evening peaks: combine two sinusoids for ~12:00 and ~18:00.
-    Returns ~0.6 to ~1.4 multiplier.
+    Takes a datetime64 array; returns a ~0.6 to ~1.4 multiplier per element.
     """
-    hour = ts.hour + ts.minute / 60.0
-    peak1 = 0.5 * (1 + sin((hour - 12) / 24 * 2 * pi))
-    peak2 = 0.5 * (1 + sin((hour - 18) / 24 * 2 * pi))
-    base = 0.6 + 0.8 * (0.6 * peak1 + 0.4 * peak2)
-    return base
+    mins = ts.astype("datetime64[m]").view("int64")
+    hours = (mins % 1440) / 60.0
+    peak1 = 0.5 * (1 + np.sin((hours - 12) / 24 * 2 * np.pi))
+    peak2 = 0.5 * (1 + np.sin((hours - 18) / 24 * 2 * np.pi))
+    return 0.6 + 0.8 * (0.6 * peak1 + 0.4 * peak2)
 
-def weekend_multiplier(ts: datetime) -> float:
-    return 1.15 if ts.weekday() >= 5 else 1.0  # Sat/Sun uplift
+def weekend_multiplier(ts: np.ndarray) -> np.ndarray:
+    days = ts.astype("datetime64[D]").view("int64")
+    weekday = (days + 3) % 7  # the epoch (1970-01-01) was a Thursday
+    return np.where(weekday >= 5, 1.15, 1.0)  # Sat/Sun uplift
 
 def price_round(p: float) -> float:
     return round(max(p, 0.01), 2)
 
-def random_lat_lon(region: str) -> Tuple[float, float]:
+def random_lat_lon(region: str, rng: np.random.Generator) -> Tuple[float, float]:
     # very rough bounding boxes
     boxes = {
         "West": (37.0, 49.5, -123.5, -121.0),
@@ -125,8 +151,8 @@ def random_lat_lon(region: str) -> Tuple[float, float]:
     }
     lat_min, lat_max, lon_min, lon_max = boxes[region]
     return (
-        round(random.uniform(lat_min, lat_max), 6),
-        round(random.uniform(lon_min, lon_max), 6),
+        round(float(rng.uniform(lat_min, lat_max)), 6),
+        round(float(rng.uniform(lon_min, lon_max)), 6),
     )
 
 
@@ -134,271 +160,333 @@ def random_lat_lon(region: str) -> Tuple[float, float]:
 # Core generators
 # -----------------------------
 
-def gen_stores(n: int, start_date: date) -> List[Dict]:
-    stores = []
-    for i in range(1, n + 1):
-        region = random.choice(REGIONS)
-        city = random.choice(CITIES_BY_REGION[region])
-        lat, lon = random_lat_lon(region)
-        opened = start_date - timedelta(days=random.randint(60, 365 * 5))
-        stores.append({
-            "store_id": i,
-            "name": f"Store {i:03d}",
-            "region": region,
-            "city": city,
-            "latitude": lat,
-            "longitude": lon,
-            "opened_date": opened.isoformat(),
-        })
-    return stores
-
-def gen_products(n: int) -> List[Dict]:
-    products = []
+def gen_stores(n: int, start_date: date, rng: np.random.Generator) -> Table:
+    region_codes = rng.integers(0, len(REGIONS), size=n, dtype=np.int8)
+    city_codes = rng.integers(0, CITY_NAMES.shape[1], size=n, dtype=np.int8)
+    regions = REGION_NAMES[region_codes]
+    lat_lon = [random_lat_lon(str(r), rng) for r in regions]
+    return {
+        "store_id": np.arange(1, n + 1, dtype=np.int32),
+        "name": [f"Store {i:03d}" for i in range(1, n + 1)],
+        "region": regions,
+        "city": CITY_NAMES[region_codes, city_codes],
+        "latitude": [ll[0] for ll in lat_lon],
+        "longitude": [ll[1] for ll in lat_lon],
+        "opened_date": np.datetime_as_string(
+            np.datetime64(start_date) - rng.integers(60, 365 * 5 + 1, size=n).astype("timedelta64[D]"),
+            unit="D",
+        ).tolist(),
+    }
+
+def gen_products(n: int, rng: np.random.Generator) -> Table:
+    cols: Table = {
+        "product_id": [], "sku": [], "name": [],
+        "category": [], "brand": [], "base_price": [],
+    }
+
+    skus = rand_skus(n, rng)
+
+    def _append(product_id: int, category: str, brand: str, base_price: float) -> None:
+        cols["product_id"].append(product_id)
+        cols["sku"].append(skus[product_id - 1])
+        cols["name"].append(f"{brand} {category} {int(rng.integers(10, 1000))}")
+        cols["category"].append(category)
+        cols["brand"].append(brand)
+        cols["base_price"].append(base_price)
+
     product_id = 1
     for category, brands in CATEGORIES.items():
         # distribute products roughly evenly across categories
         per_cat = max(1, int(n / len(CATEGORIES)))
         for _ in range(per_cat):
-            brand = random.choice(brands)
-            sku = rand_sku()
-            base_price = price_round(random.uniform(1.0, 30.0) * random.choice([0.99, 0.95, 0.9, 1.0]))
-            products.append({
-                "product_id": product_id,
-                "sku": sku,
-                "name": f"{brand} {category} {random.randint(10, 999)}",
-                "category": category,
-                "brand": brand,
-                "base_price": base_price,
-            })
+            brand = brands[int(rng.integers(0, len(brands)))]
+            base_price = price_round(
+                float(rng.uniform(1.0, 30.0)) * [0.99, 0.95, 0.9, 1.0][int(rng.integers(0, 4))]
+            )
+            _append(product_id, category, brand, base_price)
             product_id += 1
             if product_id > n:
-                return products
+                return cols
     # if rounding leaves gap, fill arbitrarily
     while product_id <= n:
-        category = random.choice(list(CATEGORIES.keys()))
-        brand = random.choice(CATEGORIES[category])
-        products.append({
-            "product_id": product_id,
-            "sku": rand_sku(),
-            "name": f"{brand} {category} {random.randint(10, 999)}",
-            "category": category,
-            "brand": brand,
-            "base_price": price_round(random.uniform(1.0, 30.0)),
-        })
+        category = list(CATEGORIES.keys())[int(rng.integers(0, len(CATEGORIES)))]
+        brand = CATEGORIES[category][int(rng.integers(0, len(CATEGORIES[category])))]
+        _append(product_id, category, brand, price_round(float(rng.uniform(1.0, 30.0))))
         product_id += 1
-    return products
-
-def gen_customers(n: int) -> List[Dict]:
-    segs = ["casual", "loyal", "bargain", "premium"]
-    customers = []
-    for i in range(1, n + 1):
-        region = random.choice(REGIONS)
-        city = random.choice(CITIES_BY_REGION[region])
-        signup = (datetime.now(timezone.utc) - timedelta(days=random.randint(30, 365 * 4))).replace(tzinfo=None)
-        customers.append({
-            "customer_id": i,
-            "segment": random.choices(segs, weights=[0.5, 0.2, 0.2, 0.1])[0],
-            "signup_ts": signup.isoformat(timespec="seconds"),
-            "home_region": region,
-            "home_city": city,
-        })
-    return customers
-
-def gen_promotions(products: List[Dict], start_d: date, end_d: date) -> List[Dict]:
-    promos = []
-    for p in products:
-        # ~25% of products have an active promo window in the period
-        if random.random() < 0.25:
-            duration = random.randint(5, 14)
-            start = start_d + timedelta(days=random.randint(0, max(0, (end_d - start_d).days - duration)))
+    return cols
+
+def gen_customers(n: int, rng: np.random.Generator) -> Table:
+    region_codes = rng.integers(0, len(REGIONS), size=n, dtype=np.int8)
+    city_codes = rng.integers(0, CITY_NAMES.shape[1], size=n, dtype=np.int8)
+    seg_codes = rng.choice(len(SEGMENTS), size=n, p=[0.5, 0.2, 0.2, 0.1])
+    now = datetime.now(timezone.utc)
+    return {
+        "customer_id": np.arange(1, n + 1, dtype=np.int32),
+        "segment": SEGMENT_NAMES[seg_codes],
+        "signup_ts": np.datetime_as_string(
+            np.datetime64(now.replace(tzinfo=None), "s")
+            - rng.integers(30, 365 * 4 + 1, size=n).astype("timedelta64[D]"),
+            unit="s",
+        ).tolist(),
+        "home_region": REGION_NAMES[region_codes],
+        "home_city": CITY_NAMES[region_codes, city_codes],
+    }
+
+def gen_promotions(products: Table, start_d: date, end_d: date, rng: np.random.Generator) -> Table:
+    cols: Table = {
+        "promo_id": [], "product_id": [], "start_date": [],
+        "end_date": [], "promo_type": [], "discount_pct": [],
+    }
+    # ~25% of products have an active promo window in the period
+    active = rng.random(len(products["product_id"])) < 0.25
+    promo_ids = iter(rand_skus(int(active.sum()), rng))
+    for pid, is_active in zip(products["product_id"], active.tolist()):
+        if is_active:
+            duration = int(rng.integers(5, 15))
+            offset = int(rng.integers(0, max(0, (end_d - start_d).days - duration) + 1))
+            start = start_d + timedelta(days=offset)
             end = start + timedelta(days=duration)
-            promo_type = random.choice(PROMO_TYPES)
-            disc = round(random.uniform(0.05, 0.30), 2)
-            promos.append({
-                "promo_id": rand_sku(),
-                "product_id": p["product_id"],
-                "start_date": start.isoformat(),
-                "end_date": end.isoformat(),
-                "promo_type": promo_type,
-                "discount_pct": disc,
-            })
-    return promos
-
-def _promo_lookup(promos: List[Dict]) -> Dict[int, List[Tuple[date, date, float]]]:
-    by_prod: Dict[int, List[Tuple[date, date, float]]] = {}
-    for pr in promos:
-        pid = pr["product_id"]
-        s = date.fromisoformat(pr["start_date"])
-        e = date.fromisoformat(pr["end_date"])
-        d = float(pr["discount_pct"])
-        by_prod.setdefault(pid, []).append((s, e, d))
-    return by_prod
-
-def is_promo_active(pid: int, ts: datetime, promo_idx: Dict[int, List[Tuple[date, date, float]]]) -> float:
-    if pid not in promo_idx:
-        return 0.0
-    d = ts.date()
-    for (s, e, disc) in promo_idx[pid]:
-        if s <= d <= e:
-            return disc
-    return 0.0
+            cols["promo_id"].append(next(promo_ids))
+            cols["product_id"].append(pid)
+            cols["start_date"].append(start.isoformat())
+            cols["end_date"].append(end.isoformat())
+            cols["promo_type"].append(PROMO_TYPES[int(rng.integers(0, len(PROMO_TYPES)))])
+            cols["discount_pct"].append(round(float(rng.uniform(0.05, 0.30)), 2))
+    return cols
+
+def _promo_discount_arrays(promos: Table, n_products: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Dense per-product promo windows (int epoch days) for vectorized lookup.
+
+    gen_promotions emits at most one window per product, so arrays indexed by
+    product_id are the whole lookup structure: an item's discount is a gather
+    plus two comparisons instead of a dict probe and a Python scan per row.
+    """
+    start = np.full(n_products + 1, np.iinfo(np.int64).max, dtype=np.int64)
+    end = np.full(n_products + 1, np.iinfo(np.int64).min, dtype=np.int64)
+    disc = np.zeros(n_products + 1, dtype=np.float64)
+    pids = np.asarray(promos["product_id"], dtype=np.int64)
+    if len(pids):
+        start[pids] = np.array(promos["start_date"], dtype="datetime64[D]").view("int64")
+        end[pids] = np.array(promos["end_date"], dtype="datetime64[D]").view("int64")
+        disc[pids] = np.asarray(promos["discount_pct"], dtype=np.float64)
+    return start, end, disc
 
 def gen_orders_and_items(
-    stores: List[Dict],
-    customers: List[Dict],
-    products: List[Dict],
+    stores: Table,
+    customers: Table,
+    products: Table,
+    promos: Table,
     start_dt: datetime,
     end_dt: datetime,
     orders_estimate: int,
     seed: int,
-) -> Tuple[List[Dict], List[Dict]]:
-    rnd = random.Random(seed + 777)
+) -> Tuple[Table, Table]:
+    rng = np.random.default_rng(seed + 777)
     # Popularity index: pre-sort products by a stable random key to create consistent "top sellers"
-    product_order = list(range(len(products)))
-    rnd.shuffle(product_order)
+    n_products = len(products["product_id"])
+    product_order = rng.permutation(n_products)
 
-    store_bias = {s["store_id"]: rnd.uniform(0.7, 1.3) for s in stores}
+    store_ids = np.asarray(stores["store_id"], dtype=np.int64)
+    customer_ids = np.asarray(customers["customer_id"], dtype=np.int64)
+    base_prices = np.asarray(products["base_price"], dtype=np.float64)
+    n_stores = len(store_ids)
+    store_bias = rng.uniform(0.7, 1.3, size=n_stores)
 
     total_minutes = int((end_dt - start_dt).total_seconds() // 60)
     # base rate per minute to reach target; we’ll modulate by diurnal/weekend/store
     base_per_minute = max(1e-6, orders_estimate / max(1, total_minutes))
 
-    orders: List[Dict] = []
-    items: List[Dict] = []
-
-    current = start_dt
-    order_counter = 0
-
-    while current <= end_dt:
-        # expected orders this minute across all stores
-        diurnal = diurnal_multiplier(current)
-        wknd = weekend_multiplier(current)
-        exp_minute = base_per_minute * diurnal * wknd
-
-        # sample a Poisson-like small integer using a geometric trick
-        minute_orders = 0
-        p = exp_minute / (1.0 + exp_minute)
-        while rnd.random() < p:
-            minute_orders += 1
-
-        for _ in range(minute_orders):
-            order_counter += 1
-            order_id = f"O{seed}{order_counter:08d}"
-
-            store = rnd.choice(stores)
-            # additional store multiplier
-            if rnd.random() > store_bias[store["store_id"]]:
-                # small chance to skip this store’s order
-                continue
-
-            customer = rnd.choice(customers)
-            payment = rnd.choices(PAYMENT_TYPES, weights=[0.7, 0.15, 0.15])[0]
-            order_disc = round(max(0.0, rnd.gauss(0.05, 0.03)), 2)
-            order_disc = min(order_disc, 0.25) if rnd.random() < 0.6 else 0.0
-
-            orders.append({
-                "order_id": order_id,
-                "store_id": store["store_id"],
-                "customer_id": customer["customer_id"],
-                "order_ts": current.isoformat(timespec="seconds"),
-                "payment_type": payment,
-                "discount_pct": order_disc,
-            })
-
-            # basket size: 1–8, skew small
-            basket_size = 1 + int(abs(rnd.gauss(1.0, 1.0)) * 2)
-            basket_size = min(max(1, basket_size), 8)
-
-            # choose products with popularity skew
-            for line_no in range(1, basket_size + 1):
-                # bias product index via zipf-like transform of shuffled base
-                base_idx = zipf_like_index(len(products), s=1.15)
-                pid = products[product_order[base_idx]]["product_id"]
-                prod = products[pid - 1]
-
-                qty = 1 if rnd.random() < 0.75 else rnd.randint(2, 5)
-
-                # promo may be active → extra discount
-                # build promo index lazily outside loop; to keep function pure, perform a light local check
-                # (we'll compute exact promo in outer call via lookup to keep logic centralized)
-                # here, we just pick base price; price adjustments will be computed by caller if needed
-                unit_price = float(prod["base_price"])
-
-                items.append({
-                    "order_id": order_id,
-                    "line_number": line_no,
-                    "product_id": pid,
-                    "qty": qty,
-                    "unit_price": unit_price,  # provisional; final price after discounts applied later
-                    "extended_price": price_round(unit_price * qty),
-                })
-
-        current += timedelta(minutes=1)
+    # Expected orders for every minute of the window, then one exact Poisson
+    # draw for the whole window instead of a geometric-trick loop per minute.
+    # The multipliers are evaluated as ufuncs over the datetime64 range — two
+    # array ops rather than thousands of scalar sin/weekday calls.
+    minute64 = np.datetime64(start_dt, "m") + np.arange(total_minutes + 1, dtype="timedelta64[m]")
+    lam = base_per_minute * diurnal_multiplier(minute64) * weekend_multiplier(minute64)
+    counts = rng.poisson(lam)
+
+    # Expand to one candidate order per sampled count, then vectorize every
+    # per-order draw over the whole batch
+    cand_minute = np.repeat(np.arange(total_minutes + 1), counts)
+    n_cand = len(cand_minute)
+    cand_store = rng.integers(0, n_stores, size=n_cand)
+    # store-bias rejection as a single branchless mask (small chance to skip)
+    accept = rng.random(n_cand) <= store_bias[cand_store]
+
+    cand_no = np.arange(1, n_cand + 1)[accept]
+    minute_idx = cand_minute[accept]
+    store_idx = cand_store[accept]
+    n_orders = len(minute_idx)
+
+    order_ids = [f"O{seed}{i:08d}" for i in cand_no.tolist()]
+    # one C-level ISO formatting pass over the minute range, then a gather —
+    # not an isoformat() call per order
+    minute_strs = np.datetime_as_string(minute64, unit="s")
+    order_ts = minute_strs[minute_idx].tolist()
+    pay_codes = rng.choice(len(PAYMENT_TYPES), size=n_orders, p=[0.7, 0.15, 0.15])
+    order_disc = np.round(np.maximum(0.0, rng.normal(0.05, 0.03, size=n_orders)), 2)
+    order_disc = np.where(rng.random(n_orders) < 0.6, np.minimum(order_disc, 0.25), 0.0)
+
+    orders: Table = {
+        "order_id": order_ids,
+        "store_id": store_ids[store_idx],
+        "customer_id": customer_ids[rng.integers(0, len(customer_ids), size=n_orders)],
+        "order_ts": order_ts,
+        "payment_type": PAYMENT_NAMES[pay_codes],
+        "discount_pct": order_disc,
+    }
 
-    return orders, items
+    # basket size: 1–8, skew small
+    basket = np.clip(1 + (np.abs(rng.normal(1.0, 1.0, size=n_orders)) * 2).astype(np.int64), 1, 8)
+    total_lines = int(basket.sum())
+    item_order = np.repeat(np.arange(n_orders), basket)
+    line_number = np.arange(total_lines) - np.repeat(np.cumsum(basket) - basket, basket) + 1
+
+    # choose products with popularity skew: one batched draw for all lines
+    base_idxs = zipf_like_indices(n_products, total_lines, rng, s=1.15)
+    pids = product_order[base_idxs] + 1
+    qty = np.where(rng.random(total_lines) < 0.75, 1, rng.integers(2, 6, size=total_lines))
+
+    # final pricing, fused into generation: the per-item order day and order
+    # discount come straight from the candidate arrays (no order_id join or
+    # timestamp reparse), so the items table is written once with its final
+    # prices instead of a second full pass over the largest table.
+    item_day = minute64[minute_idx].astype("datetime64[D]").view("int64")[item_order]
+    item_order_disc = order_disc[item_order]
+
+    # promo discount where the item's day falls inside its product's window
+    p_start, p_end, p_disc = _promo_discount_arrays(promos, n_products)
+    promo_disc = np.where(
+        (item_day >= p_start[pids]) & (item_day <= p_end[pids]), p_disc[pids], 0.0
+    )
+
+    # whole pricing pass as array math: order-level discount first, then promo.
+    # product_ids are contiguous 1..N, so the base price is a plain gather on
+    # pid-1 — no dict probe per row. The 1e-9 nudge keeps exact .005 ties
+    # rounding up like round() on the decimal-ish inputs the generator produces.
+    unit_price = np.round(
+        np.maximum(base_prices[pids - 1] * (1.0 - item_order_disc) * (1.0 - promo_disc), 0.01) + 1e-9, 2
+    )
+
+    items: Table = {
+        "order_id": np.array(order_ids, dtype=object)[item_order].tolist(),
+        "line_number": line_number,
+        "product_id": pids,
+        "qty": qty,
+        "unit_price": unit_price,
+        "extended_price": np.round(np.maximum(unit_price * qty, 0.01) + 1e-9, 2),
+    }
 
-def apply_discounts_with_promotions(
-    orders: List[Dict],
-    items: List[Dict],
-    products_by_id: Dict[int, Dict],
-    promo_idx: Dict[int, List[Tuple[date, date, float]]]
-) -> None:
-    # Map orders by id for order-level discount
-    order_map = {o["order_id"]: o for o in orders}
-    for it in items:
-        order = order_map[it["order_id"]]
-        ts = datetime.fromisoformat(order["order_ts"])
-        base_price = float(products_by_id[it["product_id"]]["base_price"])
-        # order-level discount first
-        price_after_order_disc = base_price * (1.0 - float(order["discount_pct"]))
-        # promo discount if active
-        promo_disc = is_promo_active(it["product_id"], ts, promo_idx)
-        final_unit = price_after_order_disc * (1.0 - promo_disc)
-        final_unit = price_round(final_unit)
-        it["unit_price"] = final_unit
-        it["extended_price"] = price_round(final_unit * int(it["qty"]))
+    return orders, items
 
 def gen_inventory_snapshots(
-    stores: List[Dict],
-    products: List[Dict],
+    stores: Table,
+    products: Table,
     start_d: date,
     end_d: date,
-) -> List[Dict]:
-    snaps: List[Dict] = []
+    seed: int = 0,
+    sample_frac: float = 0.2,
+):
+    # One shaped (stores x products) draw per day instead of a Python RNG call
+    # per cell; at large scale that's millions of interpreter round-trips saved.
+    # Yields one day's columns at a time so the writer streams chunks to disk
+    # and peak memory is O(stores x products), not O(days x stores x products).
+    # Each day keeps a uniform `sample_frac` of (store, product) cells — a full
+    # S x P grid per day is gratuitous at large scale, and a per-day subsample
+    # still covers every store/product pair over the window.
+    rng = np.random.default_rng(seed + 99)
+    store_ids = np.asarray(stores["store_id"], dtype=np.int32)
+    product_ids = np.asarray(products["product_id"], dtype=np.int32)
+    S, P = len(store_ids), len(product_ids)
+    sid_col = np.repeat(store_ids, P)
+    pid_col = np.tile(product_ids, S)
+
     days = (end_d - start_d).days + 1
+    # all snapshot timestamps (6am each day) formatted in one pass
+    snap_ts_strs = np.datetime_as_string(
+        np.datetime64(datetime.combine(start_d, time(6, 0, 0)), "s")
+        + np.arange(days, dtype="timedelta64[D]"),
+        unit="s",
+    )
     for d in range(days):
-        snap_date = start_d + timedelta(days=d)
-        snap_ts = datetime.combine(snap_date, time(6, 0, 0))  # 6am snapshot
-        for s in stores:
-            # sample subset of products per store to keep file sizes reasonable
-            # (for small scale we keep all)
-            for p in products:
-                on_hand = max(0, int(random.gauss(40, 15)))
-                safety = max(5, int(on_hand * random.uniform(0.15, 0.35)))
-                on_order = int(on_hand < safety) * random.randint(10, 60)
-                reorder = int(on_hand < safety) * random.randint(10, 40)
-                snaps.append({
-                    "snapshot_ts": snap_ts.isoformat(timespec="seconds"),
-                    "store_id": s["store_id"],
-                    "product_id": p["product_id"],
-                    "on_hand": on_hand,
-                    "on_order": on_order,
-                    "safety_stock": safety,
-                    "reorder_qty": reorder,
-                })
-    return snaps
+        snap_ts = str(snap_ts_strs[d])
+        on_hand = np.clip(rng.normal(40, 15, size=(S, P)), 0, None).astype(np.int32)
+        frac = rng.uniform(0.15, 0.35, size=(S, P))
+        safety = np.maximum(5, (on_hand * frac).astype(np.int32))
+        need = on_hand < safety
+        on_order = np.where(need, rng.integers(10, 61, size=(S, P), dtype=np.int32), 0)
+        reorder = np.where(need, rng.integers(10, 41, size=(S, P), dtype=np.int32), 0)
+        keep = (rng.random(S * P) < sample_frac) if sample_frac < 1.0 else slice(None)
+
+        yield {
+            "snapshot_ts": [snap_ts] * int(sid_col[keep].shape[0]),
+            "store_id": sid_col[keep],
+            "product_id": pid_col[keep],
+            "on_hand": on_hand.ravel()[keep],
+            "on_order": on_order.ravel()[keep],
+            "safety_stock": safety.ravel()[keep],
+            "reorder_qty": reorder.ravel()[keep],
+        }
 
 
 # -----------------------------
-# CSV writer
+# Writers
 # -----------------------------
 
-def write_csv(path: str, rows: List[Dict], headers: List[str]) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+def write_csv(path: str, table: Table, headers: List[str]) -> None:
+    # Column tables go straight into an Arrow table; pyarrow's CSV writer
+    # encodes column-at-a-time in C, releases the GIL and skips the per-row
+    # tuple/str round-trips of the stdlib csv module.
+    arrow_table = pa.table({h: table[h] for h in headers})
+    pacsv.write_csv(
+        arrow_table, path,
+        write_options=pacsv.WriteOptions(quoting_style="needed"),
+    )
+
+def write_csv_chunks(path: str, chunks, headers: List[str]) -> int:
+    """Stream an iterable of column chunks to one CSV; returns rows written.
+
+    Only one chunk is alive at a time, so tables too big to hold in memory
+    (inventory snapshots at large scale) go straight to disk day by day.
+    """
+    writer = None
+    rows = 0
+    for chunk in chunks:
+        arrow_table = pa.table({h: chunk[h] for h in headers})
+        if writer is None:
+            writer = pacsv.CSVWriter(
+                path, arrow_table.schema,
+                write_options=pacsv.WriteOptions(quoting_style="needed"),
+            )
+        writer.write_table(arrow_table)
+        rows += len(arrow_table)
+    if writer is not None:
+        writer.close()
+    return rows
+
+
+_PARQUET_KWARGS = dict(compression="zstd", use_dictionary=True, data_page_version="2.0")
+
+
+def write_parquet(path: str, table: Table, headers: List[str]) -> None:
+    # No numeric-to-string formatting at all: columns land on disk in their
+    # native types, with dictionary encoding soaking up the low-cardinality
+    # string columns (region, category, brand, segment, payment_type).
+    arrow_table = pa.table({h: table[h] for h in headers})
+    pq.write_table(arrow_table, path, **_PARQUET_KWARGS)
+
+def write_parquet_chunks(path: str, chunks, headers: List[str]) -> int:
+    """Parquet counterpart of write_csv_chunks: one row group per chunk."""
+    writer = None
+    rows = 0
+    for chunk in chunks:
+        arrow_table = pa.table({h: chunk[h] for h in headers})
+        if writer is None:
+            writer = pq.ParquetWriter(path, arrow_table.schema, **_PARQUET_KWARGS)
+        writer.write_table(arrow_table)
+        rows += len(arrow_table)
+    if writer is not None:
+        writer.close()
+    return rows
 
 
 # -----------------------------
@@ -411,7 +499,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     default_scale = "small"  # fallback
     default_days = 14  # fallback
     default_seed = 42  # fallback
-    
+
     if get_config:
         try:
             config = get_config()
@@ -421,31 +509,37 @@ def main(argv: Optional[List[str]] = None) -> int:
             default_seed = config.default_seed_value
         except Exception:
             pass  # Use fallbacks if config fails
-    
+
     parser = argparse.ArgumentParser(description="Generate fake retail data to CSVs.")
     parser.add_argument("--scale", choices=SCALES.keys(), default=default_scale)
     parser.add_argument("--days", type=int, default=default_days, help="Number of days of order history.")
     parser.add_argument("--start-date", type=str, default=None, help="YYYY-MM-DD (defaults to today - days + 1)")
     parser.add_argument("--output-dir", type=str, default=default_output_dir)
     parser.add_argument("--seed", type=int, default=default_seed)
-    parser.add_argument("--no-overwrite", action="store_true", help="Fail if CSVs already exist.")
+    parser.add_argument("--no-overwrite", action="store_true", help="Fail if output files already exist.")
+    parser.add_argument(
+        "--format", choices=["csv", "parquet"], default="csv",
+        help="Output format. Parquet skips all numeric-to-string formatting and "
+             "compresses far smaller for the big tables (order_items, inventory).",
+    )
     args = parser.parse_args(argv)
 
-    random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
 
     scale = SCALES[args.scale]
     outdir = args.output_dir
     ensure_dir(outdir)
 
-    # file paths
+    # file paths / writers for the chosen format
+    ext = args.format
+    write_table = write_parquet if ext == "parquet" else write_csv
+    write_table_chunks = write_parquet_chunks if ext == "parquet" else write_csv_chunks
     files = {
-        "stores": os.path.join(outdir, "stores.csv"),
-        "products": os.path.join(outdir, "products.csv"),
-        "customers": os.path.join(outdir, "customers.csv"),
-        "orders": os.path.join(outdir, "orders.csv"),
-        "order_items": os.path.join(outdir, "order_items.csv"),
-        "inventory_snapshots": os.path.join(outdir, "inventory_snapshots.csv"),
-        "promotions": os.path.join(outdir, "promotions.csv"),
+        name: os.path.join(outdir, f"{name}.{ext}")
+        for name in (
+            "stores", "products", "customers", "orders",
+            "order_items", "inventory_snapshots", "promotions",
+        )
     }
     if args.no_overwrite:
         for p in files.values():
@@ -464,52 +558,59 @@ def main(argv: Optional[List[str]] = None) -> int:
     end_dt = datetime.combine(end_d, time(23, 59, 0))
 
     # generate core dims
-    stores = gen_stores(scale.stores, start_d)
-    products = gen_products(scale.products)
-    customers = gen_customers(scale.customers)
+    stores = gen_stores(scale.stores, start_d, rng)
+    products = gen_products(scale.products, rng)
+    customers = gen_customers(scale.customers, rng)
 
-    # promotions (before orders)
-    promotions = gen_promotions(products, start_d, end_d)
-    promo_idx = _promo_lookup(promotions)
-    products_by_id = {p["product_id"]: p for p in products}
+    # promotions (before orders, so line pricing can fold them in)
+    promotions = gen_promotions(products, start_d, end_d, rng)
 
-    # orders & items
+    # orders & items, priced inline against the promo windows
     orders, items = gen_orders_and_items(
         stores=stores,
         customers=customers,
         products=products,
+        promos=promotions,
         start_dt=start_dt,
         end_dt=end_dt,
         orders_estimate=scale.orders_estimate,
         seed=args.seed,
     )
-    # apply discounts/promos to line prices
-    apply_discounts_with_promotions(orders, items, products_by_id, promo_idx)
-
-    # inventory snapshots
-    inventory = gen_inventory_snapshots(stores, products, start_d, end_d)
-
-    # write CSVs
-    write_csv(files["stores"], stores,
-              ["store_id", "name", "region", "city", "latitude", "longitude", "opened_date"])
-    write_csv(files["products"], products,
-              ["product_id", "sku", "name", "category", "brand", "base_price"])
-    write_csv(files["customers"], customers,
-              ["customer_id", "segment", "signup_ts", "home_region", "home_city"])
-    write_csv(files["orders"], orders,
-              ["order_id", "store_id", "customer_id", "order_ts", "payment_type", "discount_pct"])
-    write_csv(files["order_items"], items,
-              ["order_id", "line_number", "product_id", "qty", "unit_price", "extended_price"])
-    write_csv(files["inventory_snapshots"], inventory,
-              ["snapshot_ts", "store_id", "product_id", "on_hand", "on_order", "safety_stock", "reorder_qty"])
-    write_csv(files["promotions"], promotions,
-              ["promo_id", "product_id", "start_date", "end_date", "promo_type", "discount_pct"])
+
+    # inventory snapshots: generated lazily, streamed to disk during the write phase
+    inventory_chunks = gen_inventory_snapshots(stores, products, start_d, end_d, seed=args.seed)
+
+    # write CSVs in parallel: the seven files are independent and pyarrow's
+    # writer releases the GIL, so threads overlap encoding with I/O without
+    # pickling whole tables to worker processes
+    jobs = [
+        (files["stores"], stores,
+         ["store_id", "name", "region", "city", "latitude", "longitude", "opened_date"]),
+        (files["products"], products,
+         ["product_id", "sku", "name", "category", "brand", "base_price"]),
+        (files["customers"], customers,
+         ["customer_id", "segment", "signup_ts", "home_region", "home_city"]),
+        (files["orders"], orders,
+         ["order_id", "store_id", "customer_id", "order_ts", "payment_type", "discount_pct"]),
+        (files["order_items"], items,
+         ["order_id", "line_number", "product_id", "qty", "unit_price", "extended_price"]),
+        (files["promotions"], promotions,
+         ["promo_id", "product_id", "start_date", "end_date", "promo_type", "discount_pct"]),
+    ]
+    with ThreadPoolExecutor(max_workers=min(len(jobs) + 1, os.cpu_count() or 1)) as ex:
+        inv_fut = ex.submit(
+            write_table_chunks, files["inventory_snapshots"], inventory_chunks,
+            ["snapshot_ts", "store_id", "product_id", "on_hand", "on_order", "safety_stock", "reorder_qty"],
+        )
+        for fut in [ex.submit(write_table, *job) for job in jobs]:
+            fut.result()
+        n_inventory = inv_fut.result()
 
     # simple summary
     print(f"Generated data in {outdir}")
-    print(f" stores: {len(stores)} | products: {len(products)} | customers: {len(customers)}")
-    print(f" orders: {len(orders)} | order_items: {len(items)} | promotions: {len(promotions)}")
-    print(f" inventory_snapshots: {len(inventory)}")
+    print(f" stores: {len(stores['store_id'])} | products: {len(products['product_id'])} | customers: {len(customers['customer_id'])}")
+    print(f" orders: {len(orders['order_id'])} | order_items: {len(items['order_id'])} | promotions: {len(promotions['promo_id'])}")
+    print(f" inventory_snapshots: {n_inventory}")
     return 0
 
 
@@ -21,5 +21,4 @@ def get_data_access(kind: Literal["csv"] = "csv") -> DataAccess:
         # Reads from configured CSV folder
         config = get_config()
         return CsvDataAccess(data_dir=config.data_dir)
-    raise ValueError(f"Unknown data access kind: {kind}")
-s
\ No newline at end of file
+    raise ValueError(f"Unknown data access kind: {kind}")
\ No newline at end of file
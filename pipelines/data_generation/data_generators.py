@@ -24,6 +24,8 @@ from datetime import datetime, timedelta, date, time, timezone
 from math import ceil, sin, pi
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
 # Import config for default output directory
 try:
     from ..config import get_config
@@ -61,6 +63,15 @@ PAYMENT_TYPES = ["card", "cash", "mobile"]
 
 PROMO_TYPES = ["BOGO-lite", "PercentOff", "PriceDrop"]
 
+# Tables are columnar (struct-of-arrays): one list/ndarray per column. A dict
+# per row costs ~200 bytes of overhead and forces per-field hashing everywhere
+# downstream; columns convert to Arrow/Spark in one pass each.
+Table = Dict[str, list]
+
+def table_len(table: Table) -> int:
+    """Row count of a columnar table (0 when it has no columns)."""
+    return len(next(iter(table.values()))) if table else 0
+
 @dataclass
 class Scale:
     stores: int
@@ -83,16 +94,29 @@ def ensure_dir(path: str) -> None:
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
 
+# Module-level PCG64 generator for the bulk draws in the dimension
+# generators; seed_rng() re-seeds it for reproducible runs. The order/item
+# generator keeps its own shard-local random.Random so shards stay
+# independent across executors.
+rng = np.random.default_rng()
+
+def seed_rng(seed: int) -> None:
+    global rng
+    rng = np.random.default_rng(seed)
+
+_SKU_ALPHABET = string.ascii_uppercase + string.digits
+
 def rand_sku() -> str:
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    return "".join(_SKU_ALPHABET[i] for i in rng.integers(0, len(_SKU_ALPHABET), size=8))
 
-def zipf_like_index(n: int, s: float = 1.15) -> int:
+def zipf_like_index(rnd: random.Random, n: int, s: float = 1.15) -> int:
     """
     Return a product index [0, n-1] with a bias toward lower indices (popular items).
-    s ~1.0-1.3 controls skew.
+    s ~1.0-1.3 controls skew. Draws from the caller's generator so sharded
+    order generation stays deterministic on executors.
     """
     # Invert a Pareto-ish draw to an index
-    r = random.random()
+    r = rnd.random()
     # Normalize using harmonic approximation; simple monotonic mapping:
     idx = int((r ** (1.0 / (1.0 + s))) * n)
     if idx >= n:
@@ -125,8 +149,8 @@ def random_lat_lon(region: str) -> Tuple[float, float]:
     }
     lat_min, lat_max, lon_min, lon_max = boxes[region]
     return (
-        round(random.uniform(lat_min, lat_max), 6),
-        round(random.uniform(lon_min, lon_max), 6),
+        round(float(rng.uniform(lat_min, lat_max)), 6),
+        round(float(rng.uniform(lon_min, lon_max)), 6),
     )
 
 
@@ -134,142 +158,188 @@ def random_lat_lon(region: str) -> Tuple[float, float]:
 # Core generators
 # -----------------------------
 
-def gen_stores(n: int, start_date: date) -> List[Dict]:
-    stores = []
+def gen_stores(n: int, start_date: date) -> Table:
+    cols: Table = {
+        "store_id": [], "name": [], "region": [], "city": [],
+        "latitude": [], "longitude": [], "opened_date": [],
+    }
+    region_idx = rng.integers(0, len(REGIONS), size=n)
+    city_u = rng.random(n)
+    opened_days = rng.integers(60, 365 * 5 + 1, size=n)
     for i in range(1, n + 1):
-        region = random.choice(REGIONS)
-        city = random.choice(CITIES_BY_REGION[region])
+        region = REGIONS[region_idx[i - 1]]
+        cities = CITIES_BY_REGION[region]
+        city = cities[int(city_u[i - 1] * len(cities))]
         lat, lon = random_lat_lon(region)
-        opened = start_date - timedelta(days=random.randint(60, 365 * 5))
-        stores.append({
-            "store_id": i,
-            "name": f"Store {i:03d}",
-            "region": region,
-            "city": city,
-            "latitude": lat,
-            "longitude": lon,
-            "opened_date": opened.isoformat(),
-        })
-    return stores
-
-def gen_products(n: int) -> List[Dict]:
-    products = []
+        opened = start_date - timedelta(days=int(opened_days[i - 1]))
+        cols["store_id"].append(i)
+        cols["name"].append(f"Store {i:03d}")
+        cols["region"].append(region)
+        cols["city"].append(city)
+        cols["latitude"].append(lat)
+        cols["longitude"].append(lon)
+        cols["opened_date"].append(opened.isoformat())
+    return cols
+
+def gen_products(n: int) -> Table:
+    cols: Table = {
+        "product_id": [], "sku": [], "name": [],
+        "category": [], "brand": [], "base_price": [],
+    }
+
+    # Bulk-draw the per-product randomness once; the loop then just consumes
+    # arrays by product id.
+    name_nums = rng.integers(10, 1000, size=n)
+    raw_prices = rng.uniform(1.0, 30.0, size=n)
+    price_mults = rng.choice([0.99, 0.95, 0.9, 1.0], size=n)
+    brand_u = rng.random(n)
+
+    def _append(product_id: int, category: str, brands: List[str], base_price: float) -> None:
+        brand = brands[int(brand_u[product_id - 1] * len(brands))]
+        cols["product_id"].append(product_id)
+        cols["sku"].append(rand_sku())
+        cols["name"].append(f"{brand} {category} {name_nums[product_id - 1]}")
+        cols["category"].append(category)
+        cols["brand"].append(brand)
+        cols["base_price"].append(base_price)
+
     product_id = 1
     for category, brands in CATEGORIES.items():
         # distribute products roughly evenly across categories
         per_cat = max(1, int(n / len(CATEGORIES)))
         for _ in range(per_cat):
-            brand = random.choice(brands)
-            sku = rand_sku()
-            base_price = price_round(random.uniform(1.0, 30.0) * random.choice([0.99, 0.95, 0.9, 1.0]))
-            products.append({
-                "product_id": product_id,
-                "sku": sku,
-                "name": f"{brand} {category} {random.randint(10, 999)}",
-                "category": category,
-                "brand": brand,
-                "base_price": base_price,
-            })
+            base_price = price_round(raw_prices[product_id - 1] * price_mults[product_id - 1])
+            _append(product_id, category, brands, base_price)
             product_id += 1
             if product_id > n:
-                return products
+                return cols
     # if rounding leaves gap, fill arbitrarily
+    category_names = list(CATEGORIES.keys())
     while product_id <= n:
-        category = random.choice(list(CATEGORIES.keys()))
-        brand = random.choice(CATEGORIES[category])
-        products.append({
-            "product_id": product_id,
-            "sku": rand_sku(),
-            "name": f"{brand} {category} {random.randint(10, 999)}",
-            "category": category,
-            "brand": brand,
-            "base_price": price_round(random.uniform(1.0, 30.0)),
-        })
+        category = category_names[int(rng.integers(len(category_names)))]
+        _append(product_id, category, CATEGORIES[category], price_round(raw_prices[product_id - 1]))
         product_id += 1
-    return products
+    return cols
 
-def gen_customers(n: int) -> List[Dict]:
+def gen_customers(n: int) -> Table:
     segs = ["casual", "loyal", "bargain", "premium"]
-    customers = []
+    cols: Table = {
+        "customer_id": [], "segment": [], "signup_ts": [],
+        "home_region": [], "home_city": [],
+    }
+    # Customers are the largest dimension (120k at large scale), so all the
+    # randomness is drawn as whole arrays up front.
+    region_idx = rng.integers(0, len(REGIONS), size=n)
+    city_u = rng.random(n)
+    segments = rng.choice(segs, size=n, p=[0.5, 0.2, 0.2, 0.1])
+    signup_days = rng.integers(30, 365 * 4 + 1, size=n)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
     for i in range(1, n + 1):
-        region = random.choice(REGIONS)
-        city = random.choice(CITIES_BY_REGION[region])
-        signup = (datetime.now(timezone.utc) - timedelta(days=random.randint(30, 365 * 4))).replace(tzinfo=None)
-        customers.append({
-            "customer_id": i,
-            "segment": random.choices(segs, weights=[0.5, 0.2, 0.2, 0.1])[0],
-            "signup_ts": signup.isoformat(timespec="seconds"),
-            "home_region": region,
-            "home_city": city,
-        })
-    return customers
-
-def gen_promotions(products: List[Dict], start_d: date, end_d: date) -> List[Dict]:
-    promos = []
-    for p in products:
-        # ~25% of products have an active promo window in the period
-        if random.random() < 0.25:
-            duration = random.randint(5, 14)
-            start = start_d + timedelta(days=random.randint(0, max(0, (end_d - start_d).days - duration)))
-            end = start + timedelta(days=duration)
-            promo_type = random.choice(PROMO_TYPES)
-            disc = round(random.uniform(0.05, 0.30), 2)
-            promos.append({
-                "promo_id": rand_sku(),
-                "product_id": p["product_id"],
-                "start_date": start.isoformat(),
-                "end_date": end.isoformat(),
-                "promo_type": promo_type,
-                "discount_pct": disc,
-            })
-    return promos
-
-def _promo_lookup(promos: List[Dict]) -> Dict[int, List[Tuple[date, date, float]]]:
-    by_prod: Dict[int, List[Tuple[date, date, float]]] = {}
-    for pr in promos:
-        pid = pr["product_id"]
-        s = date.fromisoformat(pr["start_date"])
-        e = date.fromisoformat(pr["end_date"])
-        d = float(pr["discount_pct"])
-        by_prod.setdefault(pid, []).append((s, e, d))
-    return by_prod
-
-def is_promo_active(pid: int, ts: datetime, promo_idx: Dict[int, List[Tuple[date, date, float]]]) -> float:
-    if pid not in promo_idx:
-        return 0.0
-    d = ts.date()
-    for (s, e, disc) in promo_idx[pid]:
-        if s <= d <= e:
-            return disc
-    return 0.0
+        region = REGIONS[region_idx[i - 1]]
+        cities = CITIES_BY_REGION[region]
+        signup = now - timedelta(days=int(signup_days[i - 1]))
+        cols["customer_id"].append(i)
+        cols["segment"].append(str(segments[i - 1]))
+        cols["signup_ts"].append(signup.isoformat(timespec="seconds"))
+        cols["home_region"].append(region)
+        cols["home_city"].append(cities[int(city_u[i - 1] * len(cities))])
+    return cols
+
+def gen_promotions(products: Table, start_d: date, end_d: date) -> Table:
+    cols: Table = {
+        "promo_id": [], "product_id": [], "start_date": [],
+        "end_date": [], "promo_type": [], "discount_pct": [],
+    }
+    n = table_len(products)
+    span = (end_d - start_d).days
+    # ~25% of products have an active promo window in the period
+    active = rng.random(n) < 0.25
+    durations = rng.integers(5, 15, size=n)
+    offsets = rng.integers(0, np.maximum(0, span - durations) + 1)
+    type_idx = rng.integers(0, len(PROMO_TYPES), size=n)
+    discounts = np.round(rng.uniform(0.05, 0.30, size=n), 2)
+    for k, pid in enumerate(products["product_id"]):
+        if not active[k]:
+            continue
+        start = start_d + timedelta(days=int(offsets[k]))
+        end = start + timedelta(days=int(durations[k]))
+        cols["promo_id"].append(rand_sku())
+        cols["product_id"].append(pid)
+        cols["start_date"].append(start.isoformat())
+        cols["end_date"].append(end.isoformat())
+        cols["promo_type"].append(PROMO_TYPES[type_idx[k]])
+        cols["discount_pct"].append(float(discounts[k]))
+    return cols
+
+PromoIndex = Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]
+
+def _promo_lookup(promos: Table) -> PromoIndex:
+    """Promo windows as product-id-sorted NumPy arrays.
+
+    The generator emits at most one promo per product, so a single
+    searchsorted probe per item resolves its (start, end, discount) window;
+    dates are stored as ordinals so the window check is integer compares.
+    """
+    pids = np.asarray(promos["product_id"], dtype=np.int64)
+    order = np.argsort(pids)
+    starts = np.array([date.fromisoformat(s).toordinal() for s in promos["start_date"]], dtype=np.int64)
+    ends = np.array([date.fromisoformat(e).toordinal() for e in promos["end_date"]], dtype=np.int64)
+    discs = np.asarray(promos["discount_pct"], dtype=np.float64)
+    return pids[order], starts[order], ends[order], discs[order]
 
 def gen_orders_and_items(
-    stores: List[Dict],
-    customers: List[Dict],
-    products: List[Dict],
+    stores: Table,
+    customers: Table,
+    products: Table,
     start_dt: datetime,
     end_dt: datetime,
     orders_estimate: int,
     seed: int,
-) -> Tuple[List[Dict], List[Dict]]:
-    rnd = random.Random(seed + 777)
+    shard_idx: int = 0,
+    num_shards: int = 1,
+) -> Tuple[Table, Table]:
+    # Shard-stable randomness: popularity order and store bias are drawn from
+    # a generator seeded only by the run seed so every shard agrees on them;
+    # per-order draws come from a shard-local generator so shards can run
+    # independently (e.g. on Spark executors) without shared state.
+    dims_rnd = random.Random(seed + 777)
+    rnd = random.Random(seed + 777 + shard_idx * 7919)
+    n_products = table_len(products)
+    base_prices = products["base_price"]
+    product_ids = products["product_id"]
+    store_ids = stores["store_id"]
+    customer_ids = customers["customer_id"]
+
     # Popularity index: pre-sort products by a stable random key to create consistent "top sellers"
-    product_order = list(range(len(products)))
-    rnd.shuffle(product_order)
+    product_order = list(range(n_products))
+    dims_rnd.shuffle(product_order)
 
-    store_bias = {s["store_id"]: rnd.uniform(0.7, 1.3) for s in stores}
+    store_bias = {sid: dims_rnd.uniform(0.7, 1.3) for sid in store_ids}
 
     total_minutes = int((end_dt - start_dt).total_seconds() // 60)
     # base rate per minute to reach target; we’ll modulate by diurnal/weekend/store
     base_per_minute = max(1e-6, orders_estimate / max(1, total_minutes))
 
-    orders: List[Dict] = []
-    items: List[Dict] = []
+    # Each shard owns a contiguous slice of the minute range; with one shard
+    # that slice is the whole window.
+    shard_lo = (total_minutes + 1) * shard_idx // num_shards
+    shard_hi = (total_minutes + 1) * (shard_idx + 1) // num_shards
+    shard_start = start_dt + timedelta(minutes=shard_lo)
+    shard_end = start_dt + timedelta(minutes=shard_hi - 1)
+
+    orders: Table = {
+        "order_id": [], "store_id": [], "customer_id": [],
+        "order_ts": [], "payment_type": [], "discount_pct": [],
+    }
+    items: Table = {
+        "order_id": [], "line_number": [], "product_id": [],
+        "qty": [], "unit_price": [], "extended_price": [],
+    }
 
-    current = start_dt
+    current = shard_start
     order_counter = 0
 
-    while current <= end_dt:
+    while current <= shard_end:
         # expected orders this minute across all stores
         diurnal = diurnal_multiplier(current)
         wknd = weekend_multiplier(current)
@@ -283,27 +353,27 @@ def gen_orders_and_items(
 
         for _ in range(minute_orders):
             order_counter += 1
-            order_id = f"O{seed}{order_counter:08d}"
+            # The zero-padded shard index keeps ids unique across shards
+            # without coordination (and is a fixed "00" in the single-shard
+            # CSV flow).
+            order_id = f"O{seed}{shard_idx:02d}{order_counter:08d}"
 
-            store = rnd.choice(stores)
+            store_id = rnd.choice(store_ids)
             # additional store multiplier
-            if rnd.random() > store_bias[store["store_id"]]:
+            if rnd.random() > store_bias[store_id]:
                 # small chance to skip this store’s order
                 continue
 
-            customer = rnd.choice(customers)
             payment = rnd.choices(PAYMENT_TYPES, weights=[0.7, 0.15, 0.15])[0]
             order_disc = round(max(0.0, rnd.gauss(0.05, 0.03)), 2)
             order_disc = min(order_disc, 0.25) if rnd.random() < 0.6 else 0.0
 
-            orders.append({
-                "order_id": order_id,
-                "store_id": store["store_id"],
-                "customer_id": customer["customer_id"],
-                "order_ts": current.isoformat(timespec="seconds"),
-                "payment_type": payment,
-                "discount_pct": order_disc,
-            })
+            orders["order_id"].append(order_id)
+            orders["store_id"].append(store_id)
+            orders["customer_id"].append(rnd.choice(customer_ids))
+            orders["order_ts"].append(current.isoformat(timespec="seconds"))
+            orders["payment_type"].append(payment)
+            orders["discount_pct"].append(order_disc)
 
             # basket size: 1–8, skew small
             basket_size = 1 + int(abs(rnd.gauss(1.0, 1.0)) * 2)
@@ -312,9 +382,8 @@ def gen_orders_and_items(
             # choose products with popularity skew
             for line_no in range(1, basket_size + 1):
                 # bias product index via zipf-like transform of shuffled base
-                base_idx = zipf_like_index(len(products), s=1.15)
-                pid = products[product_order[base_idx]]["product_id"]
-                prod = products[pid - 1]
+                base_idx = zipf_like_index(rnd, n_products, s=1.15)
+                pid = product_ids[product_order[base_idx]]
 
                 qty = 1 if rnd.random() < 0.75 else rnd.randint(2, 5)
 
@@ -322,83 +391,104 @@ def gen_orders_and_items(
                 # build promo index lazily outside loop; to keep function pure, perform a light local check
                 # (we'll compute exact promo in outer call via lookup to keep logic centralized)
                 # here, we just pick base price; price adjustments will be computed by caller if needed
-                unit_price = float(prod["base_price"])
+                unit_price = float(base_prices[pid - 1])
 
-                items.append({
-                    "order_id": order_id,
-                    "line_number": line_no,
-                    "product_id": pid,
-                    "qty": qty,
-                    "unit_price": unit_price,  # provisional; final price after discounts applied later
-                    "extended_price": price_round(unit_price * qty),
-                })
+                items["order_id"].append(order_id)
+                items["line_number"].append(line_no)
+                items["product_id"].append(pid)
+                items["qty"].append(qty)
+                items["unit_price"].append(unit_price)  # provisional; final price after discounts applied later
+                items["extended_price"].append(price_round(unit_price * qty))
 
         current += timedelta(minutes=1)
 
     return orders, items
 
 def apply_discounts_with_promotions(
-    orders: List[Dict],
-    items: List[Dict],
-    products_by_id: Dict[int, Dict],
-    promo_idx: Dict[int, List[Tuple[date, date, float]]]
+    orders: Table,
+    items: Table,
+    base_prices: List[float],
+    promo_idx: PromoIndex,
 ) -> None:
-    # Map orders by id for order-level discount
-    order_map = {o["order_id"]: o for o in orders}
-    for it in items:
-        order = order_map[it["order_id"]]
-        ts = datetime.fromisoformat(order["order_ts"])
-        base_price = float(products_by_id[it["product_id"]]["base_price"])
-        # order-level discount first
-        price_after_order_disc = base_price * (1.0 - float(order["discount_pct"]))
-        # promo discount if active
-        promo_disc = is_promo_active(it["product_id"], ts, promo_idx)
-        final_unit = price_after_order_disc * (1.0 - promo_disc)
-        final_unit = price_round(final_unit)
-        it["unit_price"] = final_unit
-        it["extended_price"] = price_round(final_unit * int(it["qty"]))
+    # Fully vectorized price pass: items resolve their order's discount/date
+    # and any active promo window with two searchsorted probes, then both
+    # price columns are computed as NumPy expressions. base_prices is the
+    # products["base_price"] column indexed by product_id - 1 (ids are
+    # contiguous from 1), so no id->price dict needs to be materialized.
+    # Order ids are emitted in ascending order, so the orders column is
+    # already sorted for searchsorted.
+    promo_pid, promo_start, promo_end, promo_disc = promo_idx
+
+    order_ids = np.asarray(orders["order_id"])
+    order_disc = np.asarray(orders["discount_pct"], dtype=np.float64)
+    order_day = np.array([date.fromisoformat(ts[:10]).toordinal() for ts in orders["order_ts"]], dtype=np.int64)
+
+    pid = np.asarray(items["product_id"], dtype=np.int64)
+    qty = np.asarray(items["qty"], dtype=np.int64)
+    oidx = np.searchsorted(order_ids, np.asarray(items["order_id"]))
+
+    if promo_pid.size:
+        pidx = np.clip(np.searchsorted(promo_pid, pid), 0, promo_pid.size - 1)
+        day = order_day[oidx]
+        active = (promo_pid[pidx] == pid) & (promo_start[pidx] <= day) & (day <= promo_end[pidx])
+        item_promo_disc = np.where(active, promo_disc[pidx], 0.0)
+    else:
+        item_promo_disc = np.zeros(pid.size, dtype=np.float64)
+
+    base = np.asarray(base_prices, dtype=np.float64)[pid - 1]
+    # order-level discount first, then promo discount, floored and rounded
+    # like price_round (np.round is also round-half-even)
+    unit = np.maximum(base * (1.0 - order_disc[oidx]) * (1.0 - item_promo_disc), 0.01).round(2)
+    extended = np.maximum(unit * qty, 0.01).round(2)
+    items["unit_price"] = unit.tolist()
+    items["extended_price"] = extended.tolist()
 
 def gen_inventory_snapshots(
-    stores: List[Dict],
-    products: List[Dict],
+    stores: Table,
+    products: Table,
     start_d: date,
     end_d: date,
-) -> List[Dict]:
-    snaps: List[Dict] = []
+) -> Table:
+    # One NumPy draw per column over the full day x store x product cross
+    # product instead of a Python triple loop (at large scale that loop is
+    # 1M+ rows/day).
     days = (end_d - start_d).days + 1
-    for d in range(days):
-        snap_date = start_d + timedelta(days=d)
-        snap_ts = datetime.combine(snap_date, time(6, 0, 0))  # 6am snapshot
-        for s in stores:
-            # sample subset of products per store to keep file sizes reasonable
-            # (for small scale we keep all)
-            for p in products:
-                on_hand = max(0, int(random.gauss(40, 15)))
-                safety = max(5, int(on_hand * random.uniform(0.15, 0.35)))
-                on_order = int(on_hand < safety) * random.randint(10, 60)
-                reorder = int(on_hand < safety) * random.randint(10, 40)
-                snaps.append({
-                    "snapshot_ts": snap_ts.isoformat(timespec="seconds"),
-                    "store_id": s["store_id"],
-                    "product_id": p["product_id"],
-                    "on_hand": on_hand,
-                    "on_order": on_order,
-                    "safety_stock": safety,
-                    "reorder_qty": reorder,
-                })
-    return snaps
+    store_ids = np.asarray(stores["store_id"], dtype=np.int64)
+    product_ids = np.asarray(products["product_id"], dtype=np.int64)
+    n_stores = store_ids.size
+    n_products = product_ids.size
+    n = days * n_stores * n_products
+
+    on_hand = np.maximum(0, rng.normal(40, 15, size=n).astype(np.int64))
+    safety = np.maximum(5, (on_hand * rng.uniform(0.15, 0.35, size=n)).astype(np.int64))
+    below = on_hand < safety
+    on_order = np.where(below, rng.integers(10, 61, size=n), 0)
+    reorder = np.where(below, rng.integers(10, 41, size=n), 0)
+
+    snap_ts = [
+        datetime.combine(start_d + timedelta(days=d), time(6, 0, 0)).isoformat(timespec="seconds")  # 6am snapshot
+        for d in range(days)
+    ]
+    return {
+        "snapshot_ts": [ts for ts in snap_ts for _ in range(n_stores * n_products)],
+        "store_id": np.tile(np.repeat(store_ids, n_products), days).tolist(),
+        "product_id": np.tile(product_ids, days * n_stores).tolist(),
+        "on_hand": on_hand.tolist(),
+        "on_order": on_order.tolist(),
+        "safety_stock": safety.tolist(),
+        "reorder_qty": reorder.tolist(),
+    }
 
 
 # -----------------------------
 # CSV writer
 # -----------------------------
 
-def write_csv(path: str, rows: List[Dict], headers: List[str]) -> None:
+def write_csv(path: str, table: Table, headers: List[str]) -> None:
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+        w = csv.writer(f)
+        w.writerow(headers)
+        w.writerows(zip(*(table[h] for h in headers)))
 
 
 # -----------------------------
@@ -431,7 +521,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--no-overwrite", action="store_true", help="Fail if CSVs already exist.")
     args = parser.parse_args(argv)
 
-    random.seed(args.seed)
+    seed_rng(args.seed)
 
     scale = SCALES[args.scale]
     outdir = args.output_dir
@@ -471,7 +561,6 @@ def main(argv: Optional[List[str]] = None) -> int:
     # promotions (before orders)
     promotions = gen_promotions(products, start_d, end_d)
     promo_idx = _promo_lookup(promotions)
-    products_by_id = {p["product_id"]: p for p in products}
 
     # orders & items
     orders, items = gen_orders_and_items(
@@ -484,7 +573,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         seed=args.seed,
     )
     # apply discounts/promos to line prices
-    apply_discounts_with_promotions(orders, items, products_by_id, promo_idx)
+    apply_discounts_with_promotions(orders, items, products["base_price"], promo_idx)
 
     # inventory snapshots
     inventory = gen_inventory_snapshots(stores, products, start_d, end_d)
@@ -507,9 +596,9 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # simple summary
     print(f"Generated data in {outdir}")
-    print(f" stores: {len(stores)} | products: {len(products)} | customers: {len(customers)}")
-    print(f" orders: {len(orders)} | order_items: {len(items)} | promotions: {len(promotions)}")
-    print(f" inventory_snapshots: {len(inventory)}")
+    print(f" stores: {table_len(stores)} | products: {table_len(products)} | customers: {table_len(customers)}")
+    print(f" orders: {table_len(orders)} | order_items: {table_len(items)} | promotions: {table_len(promotions)}")
+    print(f" inventory_snapshots: {table_len(inventory)}")
     return 0
 
 
@@ -25,8 +25,12 @@ Note: Catalog and schema are passed as parameters to handle target-specific nami
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date, time, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
 
 from pyspark.sql import SparkSession
 from pyspark.sql.types import *
@@ -35,8 +39,7 @@ from pyspark.sql.functions import *
 # Import the data generation functions from the local data_generators.py file
 from data_generators import (
     gen_stores, gen_products, gen_customers, gen_promotions,
-    gen_orders_and_items, apply_discounts_with_promotions,
-    gen_inventory_snapshots, _promo_lookup
+    gen_orders_and_items, gen_inventory_snapshots, seed_rng, table_len
 )
 
 # Get parameters from command line arguments
@@ -60,15 +63,29 @@ print(f"  Days: {days}")
 print(f"  Overwrite: {overwrite}")
 print(f"  Seed: {seed}")
 
-# Initialize Spark session
-spark = SparkSession.builder.appName("SampleDataGeneration").getOrCreate()
+# Initialize Spark session. The serializer buffers are sized up front so the
+# large-scale tables cannot abort the Arrow transfer mid-write.
+spark = (
+    SparkSession.builder.appName("SampleDataGeneration")
+    .config("spark.kryoserializer.buffer.max", "512m")
+    .config("spark.driver.maxResultSize", "4g")
+    .config("spark.scheduler.mode", "FAIR")
+    .getOrCreate()
+)
+
+# Arrow-based conversion: createDataFrame then consumes columnar batches
+# instead of pickling Python rows into the JVM one at a time.
+spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
 
-# Set the catalog and schema from parameters
-print(f"Setting catalog to: {catalog}")
-spark.sql(f"USE CATALOG {catalog}")
+# Let Delta right-size files on write and compact small ones inline, so the
+# partitioned fact tables don't need a separate OPTIMIZE pass afterwards.
+spark.conf.set("spark.databricks.delta.optimizeWrite.enabled", "true")
+spark.conf.set("spark.databricks.delta.autoCompact.enabled", "true")
 
-print(f"Setting schema to: {schema}")
-spark.sql(f"USE SCHEMA {schema}")
+# Every write resolves tables through the fully qualified
+# {catalog}.{schema}.{table} name, so there's no need to mutate the session's
+# current catalog/schema at startup (each USE is a metastore round trip).
+print(f"Writing to: {catalog}.{schema}")
 
 # Define the data scales (matching data_generators.py)
 SCALES = {
@@ -82,9 +99,8 @@ if scale not in SCALES:
 
 scale_config = SCALES[scale]
 
-# Set random seed for reproducibility
-import random
-random.seed(seed)
+# Seed the shared NumPy generator the dimension generators draw from
+seed_rng(seed)
 
 # Calculate time window
 start_d = (datetime.now(timezone.utc).date() - timedelta(days=days - 1))
@@ -94,102 +110,327 @@ end_dt = datetime.combine(end_d, time(23, 59, 0))
 
 print(f"Generating data for period: {start_d} to {end_d}")
 
-def write_dataframe_to_delta(df, table_name: str, overwrite: bool = False):
-    """Write a DataFrame to a Delta table with proper error handling."""
+def write_dataframe_to_delta(df, table_name: str, overwrite: bool = False, row_count: int = None,
+                             partition_by: List[str] = None, num_files: int = None):
+    """Write a DataFrame to a Delta table with proper error handling.
+
+    The row count is known from generation, so the success log uses it
+    directly; a post-write spark.table(...).count() would launch one full
+    table scan per table just to confirm a number we already have.
+
+    partition_by partitions the fact tables (orders/items by order date) so
+    downstream range queries prune whole partitions. num_files coalesces
+    before the write: the dimension tables are a few KB and should land as
+    one file each without even the optimizeWrite bin-packing shuffle; the
+    big fact tables omit it and let optimizeWrite size files per partition.
+    Schema evolution is pinned off: the schemas are declared in this file,
+    and disabling it saves the writer a Delta protocol negotiation per call.
+    """
     full_table_name = f"{catalog}.{schema}.{table_name}"
 
     try:
+        if num_files:
+            df = df.coalesce(num_files)
+        writer = df.write.format("delta").option("overwriteSchema", "false").option("mergeSchema", "false")
+        if partition_by:
+            writer = writer.partitionBy(*partition_by)
         if overwrite:
             print(f"Writing {table_name} (overwrite mode)...")
-            df.write.format("delta").mode("overwrite").saveAsTable(full_table_name)
+            writer.mode("overwrite").saveAsTable(full_table_name)
         else:
             print(f"Writing {table_name} (append mode)...")
-            df.write.format("delta").mode("append").saveAsTable(full_table_name)
+            writer.mode("append").saveAsTable(full_table_name)
 
-        # Verify the write
-        row_count = spark.table(full_table_name).count()
-        print(f"✓ Successfully wrote {table_name} with {row_count} rows")
+        written = f" with {row_count} rows" if row_count is not None else ""
+        print(f"✓ Successfully wrote {table_name}{written}")
 
     except Exception as e:
         print(f"✗ Failed to write {table_name}: {str(e)}")
         raise
 
-def create_dataframe_from_dicts(data: List[Dict], table_name: str):
-    """Convert a list of dictionaries to a Spark DataFrame."""
-    if not data:
+def write_in_pool(df, table_name: str, overwrite: bool = False, row_count: int = None,
+                  partition_by: List[str] = None, num_files: int = None):
+    """write_dataframe_to_delta wrapped for executor threads.
+
+    Spark local properties are thread-local, so each write thread must opt
+    into the fair pool itself before launching its job; otherwise concurrent
+    writes land in the default FIFO pool and serialize anyway.
+    """
+    spark.sparkContext.setLocalProperty("spark.scheduler.pool", "fair")
+    write_dataframe_to_delta(df, table_name, overwrite, row_count=row_count,
+                             partition_by=partition_by, num_files=num_files)
+
+# Explicit Arrow schemas for every generated table. pa.table() otherwise
+# infers each column's type by scanning its values; declaring them once makes
+# conversion single-pass and pins the Delta column types independent of what
+# a particular seed happened to generate. Timestamps/dates stay ISO strings
+# and prices stay float64 to match what the generators emit and what the CSV
+# flow writes.
+ARROW_SCHEMAS: Dict[str, pa.Schema] = {
+    "stores": pa.schema([
+        ("store_id", pa.int64()),
+        ("name", pa.string()),
+        ("region", pa.string()),
+        ("city", pa.string()),
+        ("latitude", pa.float64()),
+        ("longitude", pa.float64()),
+        ("opened_date", pa.string()),
+    ]),
+    "products": pa.schema([
+        ("product_id", pa.int64()),
+        ("sku", pa.string()),
+        ("name", pa.string()),
+        ("category", pa.string()),
+        ("brand", pa.string()),
+        ("base_price", pa.float64()),
+    ]),
+    "customers": pa.schema([
+        ("customer_id", pa.int64()),
+        ("segment", pa.string()),
+        ("signup_ts", pa.string()),
+        ("home_region", pa.string()),
+        ("home_city", pa.string()),
+    ]),
+    "promotions": pa.schema([
+        ("promo_id", pa.string()),
+        ("product_id", pa.int64()),
+        ("start_date", pa.string()),
+        ("end_date", pa.string()),
+        ("promo_type", pa.string()),
+        ("discount_pct", pa.float64()),
+    ]),
+    "orders": pa.schema([
+        ("order_id", pa.string()),
+        ("store_id", pa.int64()),
+        ("customer_id", pa.int64()),
+        ("order_ts", pa.string()),
+        ("payment_type", pa.string()),
+        ("discount_pct", pa.float64()),
+    ]),
+    "order_items": pa.schema([
+        ("order_id", pa.string()),
+        ("line_number", pa.int64()),
+        ("product_id", pa.int64()),
+        ("qty", pa.int64()),
+        ("unit_price", pa.float64()),
+        ("extended_price", pa.float64()),
+    ]),
+    "inventory_snapshots": pa.schema([
+        ("snapshot_ts", pa.string()),
+        ("store_id", pa.int64()),
+        ("product_id", pa.int64()),
+        ("on_hand", pa.int64()),
+        ("on_order", pa.int64()),
+        ("safety_stock", pa.int64()),
+        ("reorder_qty", pa.int64()),
+    ]),
+}
+
+def batch_size_for(row_width_bytes: int) -> int:
+    """Arrow records per batch so one batch stays around 256 KB (L2-sized).
+
+    Spark's default of 10000 records makes wide tables stream multi-MB
+    batches through the Arrow->JVM copy; sizing by measured row width keeps
+    the copy cache-resident regardless of column count.
+    """
+    return max(1024, (256 * 1024) // max(1, row_width_bytes))
+
+_arrow_batch_size: Optional[int] = None
+
+def set_arrow_batch_size(records: int) -> None:
+    """Set maxRecordsPerBatch, skipping the JVM round trip when unchanged.
+
+    Every spark.conf.set is a py4j gateway call; tables with similar row
+    widths resolve to the same batch size, so caching the last value
+    amortizes that fixed cost across the seven conversions.
+    """
+    global _arrow_batch_size
+    if records != _arrow_batch_size:
+        spark.conf.set("spark.sql.execution.arrow.maxRecordsPerBatch", str(records))
+        _arrow_batch_size = records
+
+def create_dataframe_from_arrow(arrow_table: pa.Table, table_name: str):
+    """Convert an Arrow table to a Spark DataFrame on the columnar path.
+
+    Spark ingests the Arrow-backed pandas frame without per-row pickling or
+    schema reflection; the batch size is tuned to the measured row width.
+    """
+    if arrow_table.num_rows == 0:
         raise ValueError(f"No data generated for {table_name}")
 
-    # Convert to DataFrame
-    df = spark.createDataFrame(data)
-    print(f"Generated {table_name}: {len(data)} rows")
+    row_width = arrow_table.nbytes // arrow_table.num_rows
+    set_arrow_batch_size(batch_size_for(row_width))
+    df = spark.createDataFrame(arrow_table.to_pandas(types_mapper=pd.ArrowDtype))
+    print(f"Generated {table_name}: {arrow_table.num_rows} rows")
     return df
 
+def create_dataframe_from_columns(table: Dict[str, list], table_name: str):
+    """Convert a columnar (struct-of-arrays) table to a Spark DataFrame.
+
+    The generators emit one list per column, so each becomes an Arrow array
+    in a single pass under the table's declared schema.
+    """
+    return create_dataframe_from_arrow(pa.table(table, schema=ARROW_SCHEMAS[table_name]), table_name)
+
 try:
     print("\n=== Starting Data Generation ===")
 
+    # Generation stays sequential on the driver (each table feeds the next),
+    # but the Delta commits are independent per table, so each write is
+    # submitted to the pool as soon as its DataFrame exists and overlaps with
+    # the generation of the tables after it. FAIR scheduling lets the
+    # concurrent write jobs share executors instead of queueing FIFO.
+    pool = ThreadPoolExecutor(max_workers=4)
+    writes = {}
+
     # Step 1: Generate dimension tables
     print("\n1. Generating stores...")
     stores_data = gen_stores(scale_config["stores"], start_d)
-    stores_df = create_dataframe_from_dicts(stores_data, "stores")
-    write_dataframe_to_delta(stores_df, "stores", overwrite)
+    stores_df = create_dataframe_from_columns(stores_data, "stores")
+    writes["stores"] = pool.submit(write_in_pool, stores_df, "stores", overwrite, table_len(stores_data), None, 1)
 
     print("\n2. Generating products...")
     products_data = gen_products(scale_config["products"])
-    products_df = create_dataframe_from_dicts(products_data, "products")
-    write_dataframe_to_delta(products_df, "products", overwrite)
+    products_df = create_dataframe_from_columns(products_data, "products")
+    writes["products"] = pool.submit(write_in_pool, products_df, "products", overwrite, table_len(products_data), None, 1)
 
     print("\n3. Generating customers...")
     customers_data = gen_customers(scale_config["customers"])
-    customers_df = create_dataframe_from_dicts(customers_data, "customers")
-    write_dataframe_to_delta(customers_df, "customers", overwrite)
+    customers_df = create_dataframe_from_columns(customers_data, "customers")
+    writes["customers"] = pool.submit(write_in_pool, customers_df, "customers", overwrite, table_len(customers_data), None, 1)
 
     # Step 2: Generate promotions (depends on products)
     print("\n4. Generating promotions...")
     promotions_data = gen_promotions(products_data, start_d, end_d)
-    promotions_df = create_dataframe_from_dicts(promotions_data, "promotions")
-    write_dataframe_to_delta(promotions_df, "promotions", overwrite)
+    promotions_df = create_dataframe_from_columns(promotions_data, "promotions")
+    writes["promotions"] = pool.submit(write_in_pool, promotions_df, "promotions", overwrite, table_len(promotions_data), None, 1)
 
     # Step 3: Generate orders and order items (depends on all dimensions)
+    # The order loop is by far the most expensive generator, and it shards
+    # cleanly over the minute range, so run the shards on the executors
+    # instead of single-threaded on the driver. Dimension tables travel once
+    # as a broadcast; each shard returns its columnar tables and the driver
+    # concatenates the column lists (collect preserves partition order, so
+    # orders stay timestamp-sorted) before the usual Arrow ingest.
     print("\n5. Generating orders and order items...")
-    orders_data, items_data = gen_orders_and_items(
-        stores=stores_data,
-        customers=customers_data,
-        products=products_data,
-        start_dt=start_dt,
-        end_dt=end_dt,
-        orders_estimate=scale_config["orders_estimate"],
-        seed=seed
+    sc = spark.sparkContext
+    num_shards = max(2, sc.defaultParallelism)
+    dims_broadcast = sc.broadcast((stores_data, customers_data, products_data))
+
+    def generate_order_shard(shard_idx: int) -> Tuple[Dict[str, list], Dict[str, list]]:
+        shard_stores, shard_customers, shard_products = dims_broadcast.value
+        return gen_orders_and_items(
+            stores=shard_stores,
+            customers=shard_customers,
+            products=shard_products,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            orders_estimate=scale_config["orders_estimate"],
+            seed=seed,
+            shard_idx=shard_idx,
+            num_shards=num_shards,
+        )
+
+    shards = sc.parallelize(range(num_shards), num_shards).map(generate_order_shard).collect()
+    dims_broadcast.unpersist()
+
+    # Spill per-shard Arrow record batches to local IPC files instead of
+    # accumulating them on the heap: each shard's lists are released as soon
+    # as its batch is written, and the final tables come back via
+    # memory_map + read_all, whose buffers are file-backed (zero-copy mmap).
+    # Driver peak memory is therefore one shard plus the page cache rather
+    # than both fact tables in full.
+    spill_dir = os.environ.get("SPARK_LOCAL_DIRS", "/tmp").split(",")[0]
+    orders_spill = os.path.join(spill_dir, f"orders_spill_{seed}.arrow")
+    items_spill = os.path.join(spill_dir, f"order_items_spill_{seed}.arrow")
+    with pa.OSFile(orders_spill, "wb") as orders_sink, \
+         pa.OSFile(items_spill, "wb") as items_sink, \
+         pa.ipc.new_stream(orders_sink, ARROW_SCHEMAS["orders"]) as orders_writer, \
+         pa.ipc.new_stream(items_sink, ARROW_SCHEMAS["order_items"]) as items_writer:
+        while shards:
+            shard_orders, shard_items = shards.pop(0)
+            orders_writer.write_batch(pa.RecordBatch.from_pydict(shard_orders, schema=ARROW_SCHEMAS["orders"]))
+            items_writer.write_batch(pa.RecordBatch.from_pydict(shard_items, schema=ARROW_SCHEMAS["order_items"]))
+    orders_table = pa.ipc.open_stream(pa.memory_map(orders_spill, "r")).read_all()
+    items_table = pa.ipc.open_stream(pa.memory_map(items_spill, "r")).read_all()
+    orders_count = orders_table.num_rows
+    items_count = items_table.num_rows
+
+    # Write orders, partitioned by order date so history-range queries prune.
+    orders_df = create_dataframe_from_arrow(orders_table, "orders").withColumn(
+        "order_date", to_date(col("order_ts"))
+    )
+    writes["orders"] = pool.submit(write_in_pool, orders_df, "orders", overwrite, orders_count, ["order_date"])
+
+    # Apply discounts and promotions to order items as a Spark join instead
+    # of the Python per-item loop in apply_discounts_with_promotions: the raw
+    # unit_price is the base price, the order-level discount comes from the
+    # orders join, and the promo discount from a broadcast join against the
+    # (small, at most one promo per product) promotions table on the active
+    # date window — so neither join changes the item row count.
+    order_discounts = orders_df.select(
+        "order_id", "order_ts", col("discount_pct").alias("order_discount_pct")
+    )
+    promo_windows = broadcast(promotions_df.select(
+        col("product_id").alias("promo_product_id"),
+        col("start_date").alias("promo_start"),
+        col("end_date").alias("promo_end"),
+        col("discount_pct").alias("promo_discount_pct"),
+    ))
+    items_df = (
+        create_dataframe_from_arrow(items_table, "order_items")
+        .join(order_discounts, "order_id")
+        .join(
+            promo_windows,
+            (col("product_id") == col("promo_product_id"))
+            & to_date(col("order_ts")).between(
+                to_date(col("promo_start")), to_date(col("promo_end"))
+            ),
+            "left",
+        )
+        .withColumn("promo_discount_pct", coalesce(col("promo_discount_pct"), lit(0.0)))
+        .withColumn(
+            "unit_price",
+            round(
+                greatest(
+                    col("unit_price")
+                    * (lit(1.0) - col("order_discount_pct"))
+                    * (lit(1.0) - col("promo_discount_pct")),
+                    lit(0.01),
+                ),
+                2,
+            ),
+        )
+        .withColumn("extended_price", round(greatest(col("unit_price") * col("qty"), lit(0.01)), 2))
+        .withColumn("order_date", to_date(col("order_ts")))
+        .select("order_id", "line_number", "product_id", "qty", "unit_price", "extended_price", "order_date")
     )
 
-    # Apply discounts and promotions to order items
-    promo_idx = _promo_lookup(promotions_data)
-    products_by_id = {p["product_id"]: p for p in products_data}
-    apply_discounts_with_promotions(orders_data, items_data, products_by_id, promo_idx)
-
-    # Write orders
-    orders_df = create_dataframe_from_dicts(orders_data, "orders")
-    write_dataframe_to_delta(orders_df, "orders", overwrite)
-
-    # Write order items
-    items_df = create_dataframe_from_dicts(items_data, "order_items")
-    write_dataframe_to_delta(items_df, "order_items", overwrite)
+    # Write order items, partitioned like orders for pruning on date ranges.
+    writes["order_items"] = pool.submit(write_in_pool, items_df, "order_items", overwrite, items_count, ["order_date"])
 
     # Step 4: Generate inventory snapshots (depends on stores and products)
     print("\n6. Generating inventory snapshots...")
     inventory_data = gen_inventory_snapshots(stores_data, products_data, start_d, end_d)
-    inventory_df = create_dataframe_from_dicts(inventory_data, "inventory_snapshots")
-    write_dataframe_to_delta(inventory_df, "inventory_snapshots", overwrite)
+    inventory_df = create_dataframe_from_columns(inventory_data, "inventory_snapshots")
+    writes["inventory_snapshots"] = pool.submit(write_in_pool, inventory_df, "inventory_snapshots", overwrite, table_len(inventory_data))
+
+    # Drain every write; result() re-raises the first failure so a bad table
+    # still fails the run after the others finish.
+    for future in writes.values():
+        future.result()
+    pool.shutdown()
 
     print("\n=== Data Generation Complete ===")
     print(f"Successfully generated and wrote all tables to {catalog}.{schema}")
     print(f"Summary:")
-    print(f"  Stores: {len(stores_data)}")
-    print(f"  Products: {len(products_data)}")
-    print(f"  Customers: {len(customers_data)}")
-    print(f"  Orders: {len(orders_data)}")
-    print(f"  Order Items: {len(items_data)}")
-    print(f"  Promotions: {len(promotions_data)}")
-    print(f"  Inventory Snapshots: {len(inventory_data)}")
+    print(f"  Stores: {table_len(stores_data)}")
+    print(f"  Products: {table_len(products_data)}")
+    print(f"  Customers: {table_len(customers_data)}")
+    print(f"  Orders: {orders_count}")
+    print(f"  Order Items: {items_count}")
+    print(f"  Promotions: {table_len(promotions_data)}")
+    print(f"  Inventory Snapshots: {table_len(inventory_data)}")
 
 except Exception as e:
     print(f"\n✗ Pipeline failed: {str(e)}")